@@ -0,0 +1,27 @@
+from timeit import timeit
+
+from zpy.classes.collections.array import Array
+from zpy.operators import add, mul
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+# per-element time may grow with cache effects, but never with the input size
+MAX_GROWTH = 4.0
+
+if __name__ == "__main__":
+    cases = {
+        "map": lambda a: a.map(add(1)),
+        "flat_map": lambda a: a.flat_map(lambda x: (x, x)),
+        "apply": lambda a: Array.of(add(1), mul(2)).apply(a),
+        "product": lambda a: a.product(Array.of(1, 2)),
+    }
+    for name, case in cases.items():
+        per_element = []
+        for size in SIZES:
+            array = Array(range(size))
+            number = max(1, 100_000 // size)
+            elapsed = timeit(lambda: case(array), number=number) / number
+            per_element.append(elapsed / size)
+            print(f"{name:<10}{size:>10}{elapsed * 1e3:>12.3f} ms{per_element[-1] * 1e9:>10.1f} ns/element")
+        growth = per_element[-1] / min(per_element)
+        if growth > MAX_GROWTH:
+            raise SystemExit(f"{name} looks super-linear: per-element time grew {growth:.1f}x")
@@ -0,0 +1,15 @@
+import operator as op
+from timeit import timeit
+
+from zpy.operators import add
+
+if __name__ == "__main__":
+    number = 1_000_000
+    cases = {
+        "operator.add(a, b)": lambda: op.add(1, 2),
+        "zpy.operators.add(a, b)": lambda: add(1, 2),
+        "zpy.operators.add(a)(b)": lambda: add(1)(2),
+    }
+    for name, case in cases.items():
+        elapsed = timeit(case, number=number)
+        print(f"{name:<28}{elapsed / number * 1e9:>10.1f} ns/call")
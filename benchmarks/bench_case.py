@@ -0,0 +1,16 @@
+from random import Random
+from timeit import timeit
+
+from zpy.function import Case, When, _
+from zpy.operators import identity
+
+if __name__ == "__main__":
+    patterns = 1000
+    case = Case(
+        *(When((i, _), identity) for i in range(patterns)),
+        When(_, identity),
+    )
+    random = Random(0)
+    inputs = [(random.randrange(patterns * 2), [random.random()]) for _ in range(10_000)]
+    elapsed = timeit(lambda: [case(item) for item in inputs], number=10)
+    print(f"{patterns} patterns{elapsed / 10 / len(inputs) * 1e6:>10.2f} us/dispatch")
@@ -0,0 +1,13 @@
+from functools import reduce
+from timeit import timeit
+
+from zpy.operators import add, compose
+
+if __name__ == "__main__":
+    number = 1_000
+    for stages in (10, 100, 1000):
+        composed = compose(*[add(1)] * stages)
+        mapped = reduce(lambda f, g: f / g, [add(1)] * stages)
+        for name, pipeline in (("compose", composed), ("map", mapped)):
+            elapsed = timeit(lambda: pipeline(0), number=number)
+            print(f"{name:<8}{stages:>6} stages{elapsed / number * 1e6:>10.1f} us/call")
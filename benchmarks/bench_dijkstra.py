@@ -0,0 +1,73 @@
+import sys
+from heapq import heappop, heappush
+from operator import itemgetter
+from random import Random
+from time import perf_counter
+
+from zpy.classes.collections.graph.dary_heap import DaryHeap
+from zpy.classes.collections.graph.heap import Heap
+from zpy.classes.collections.graph.pairing_heap import PairingHeap
+
+
+def generate(nodes: int, edges: int, seed: int = 0):
+    random = Random(seed)
+    graph = [[] for _ in range(nodes)]
+    for node in range(1, nodes):
+        graph[random.randrange(node)].append((node, random.random()))
+    for _ in range(edges - nodes + 1):
+        graph[random.randrange(nodes)].append((random.randrange(nodes), random.random()))
+    return graph
+
+
+def dijkstra(graph, heap):
+    dist = [float("inf")] * len(graph)
+    handles = [None] * len(graph)
+    dist[0] = 0.0
+    handles[0] = heap.push((0.0, 0))
+    while heap:
+        d, node = heap.pop()
+        handles[node] = None
+        for target, weight in graph[node]:
+            candidate = d + weight
+            if candidate < dist[target]:
+                if handles[target] is None:
+                    handles[target] = heap.push((candidate, target))
+                else:
+                    heap.decrease_key(handles[target], (candidate, target))
+                dist[target] = candidate
+    return dist
+
+
+def dijkstra_heapq(graph):
+    dist = [float("inf")] * len(graph)
+    dist[0] = 0.0
+    queue = [(0.0, 0)]
+    while queue:
+        d, node = heappop(queue)
+        if d > dist[node]:
+            continue
+        for target, weight in graph[node]:
+            candidate = d + weight
+            if candidate < dist[target]:
+                dist[target] = candidate
+                heappush(queue, (candidate, target))
+    return dist
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** 4, 10 ** 5, 10 ** 6]
+    for edges in sizes:
+        graph = generate(edges // 8, edges)
+        expected = None
+        for name, run in (
+            ("heapq (lazy deletion)", lambda: dijkstra_heapq(graph)),
+            ("Heap", lambda: dijkstra(graph, Heap(key=itemgetter(0)))),
+            ("DaryHeap(d=4)", lambda: dijkstra(graph, DaryHeap(key=itemgetter(0), d=4))),
+            ("PairingHeap", lambda: dijkstra(graph, PairingHeap(key=itemgetter(0)))),
+        ):
+            start = perf_counter()
+            dist = run()
+            elapsed = perf_counter() - start
+            expected = expected or dist
+            assert dist == expected, f"{name} disagrees with heapq"
+            print(f"{edges:>8} edges  {name:<24}{elapsed * 1e3:>10.1f} ms")
@@ -0,0 +1,30 @@
+from heapq import heapify, heappop, heappush
+from random import Random
+from timeit import timeit
+
+from zpy.classes.collections.graph.heap import Heap
+from zpy.operators import neg
+
+if __name__ == "__main__":
+    size = 100_000
+    random = Random(0)
+    items = [random.random() for _ in range(size)]
+
+    def raw_heapq():
+        heap = [(-item, order, item) for order, item in enumerate(items)]
+        heapify(heap)
+        for order, item in enumerate(items[:size // 10], start=size):
+            heappush(heap, (-item, order, item))
+        while heap:
+            heappop(heap)
+
+    def zpy_heap():
+        heap = Heap(items, key=neg)
+        for item in items[:size // 10]:
+            heap.push(item)
+        while heap:
+            heap.pop()
+
+    for name, case in (("heapq with key tuples", raw_heapq), ("Heap", zpy_heap)):
+        elapsed = timeit(case, number=1)
+        print(f"{name:<24}{elapsed * 1e3:>10.1f} ms")
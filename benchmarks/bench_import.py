@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+MODULE = "zpy.operators"
+RUNS = 7
+# budget for the time spent in zpy's own module bodies, excluding the standard library
+BUDGET_US = 10_000
+
+
+def import_times(module: str) -> dict:
+    # measure warm imports: let the first run write bytecode even when the caller disabled it
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, env=env,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us), int(cumulative_us)
+    return times
+
+
+if __name__ == "__main__":
+    budget = int(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_US
+    import_times(MODULE)
+    runs = [import_times(MODULE) for _ in range(RUNS)]
+    best = min(runs, key=lambda times: times[MODULE][1])
+    own = {name: times for name, times in best.items() if name.split(".")[0] == "zpy"}
+    for name, (self_us, cumulative_us) in sorted(own.items(), key=lambda item: -item[1][0]):
+        print(f"{name:<40}{self_us:>10} us{cumulative_us:>10} us")
+    total = sum(self_us for self_us, _cumulative_us in own.values())
+    print(f"{'zpy total (self)':<40}{total:>10} us")
+    print(f"{MODULE + ' (cumulative)':<40}{best[MODULE][1]:>10} us")
+    if total > budget:
+        raise SystemExit(f"importing {MODULE} spends {total} us in zpy modules, over the {budget} us budget")
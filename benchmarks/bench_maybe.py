@@ -0,0 +1,25 @@
+import tracemalloc
+
+from zpy.classes.logical.maybe import Just
+
+
+class DictJust:
+    def __init__(self, m):
+        self.m = m
+
+
+def allocated(factory, count: int) -> int:
+    tracemalloc.start()
+    objects = [factory(idx) for idx in range(count)]
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current
+
+
+if __name__ == "__main__":
+    count = 10 ** 6
+    baseline = allocated(int, count)
+    for name, factory in (("__dict__ instance", DictJust), ("Just (__slots__)", Just)):
+        size = allocated(factory, count) - baseline
+        print(f"{name:<20}{size / 2 ** 20:>10.1f} MiB{size / count:>10.1f} B/object")
@@ -0,0 +1,35 @@
+from timeit import repeat
+
+import numpy as np
+
+from zpy.classes.collections.array import Array
+from zpy.classes.collections.ndarray import NdArray
+from zpy.operators import add, mul, neg
+
+SIZE = 10_000_000
+# a pipeline of known operators should stay within this factor of the hand-written numpy expression
+MAX_OVERHEAD = 1.5
+
+
+def best(case, number=3):
+    return min(repeat(case, number=number, repeat=3)) / number
+
+
+if __name__ == "__main__":
+    values = np.random.default_rng(0).random(SIZE)
+    ndarray = NdArray(values)
+    pipeline = add(1) / mul(2) / neg
+    cases = {
+        "numpy expression": lambda: 1 + 2 * -values,
+        "NdArray pipeline": lambda: pipeline / ndarray,
+        "NdArray reduce(add)": lambda: ndarray.reduce(0.0, add),
+        "NdArray lambda fallback": lambda: NdArray(values[:SIZE // 100]).map(lambda x: x + 1),
+        "Array pipeline": lambda: pipeline / Array(values[:SIZE // 100].tolist()),
+    }
+    elapsed = {name: best(case) for name, case in cases.items()}
+    for name, seconds in elapsed.items():
+        size = SIZE // 100 if "fallback" in name or name.startswith("Array") else SIZE
+        print(f"{name:<28}{seconds * 1e3:>10.1f} ms{seconds / size * 1e9:>10.2f} ns/element")
+    overhead = elapsed["NdArray pipeline"] / elapsed["numpy expression"]
+    if overhead > MAX_OVERHEAD:
+        raise SystemExit(f"NdArray pipeline is {overhead:.1f}x slower than numpy")
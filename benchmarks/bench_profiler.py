@@ -0,0 +1,15 @@
+from timeit import timeit
+
+from zpy.operators import add, mul
+from zpy.profiler import Profiler
+
+if __name__ == "__main__":
+    number = 200_000
+    pipeline = add(1) / mul(2)
+    before = timeit(lambda: pipeline(3), number=number)
+    with Profiler() as profiler:
+        enabled = timeit(lambda: pipeline(3), number=number)
+    after = timeit(lambda: pipeline(3), number=number)
+    for name, elapsed in (("before enable", before), ("enabled", enabled), ("after disable", after)):
+        print(f"{name:<16}{elapsed / number * 1e9:>10.1f} ns/call")
+    profiler.to_pstats().sort_stats("cumulative").print_stats()
@@ -0,0 +1,92 @@
+from copy import deepcopy
+from random import Random
+from time import perf_counter
+
+from zpy.classes.collections.graph.rollback_union_find import RollbackUnionFind
+
+
+def generate(nodes: int, times: int, edges: int, seed: int = 0):
+    random = Random(seed)
+    timeline = []
+    for _ in range(edges):
+        start = random.randrange(times)
+        end = random.randrange(start + 1, times + 1)
+        timeline.append((start, end, random.randrange(nodes), random.randrange(nodes)))
+    queries = [[(random.randrange(nodes), random.randrange(nodes)) for _ in range(4)] for _ in range(times)]
+    return timeline, queries
+
+
+def segments(timeline, times: int):
+    tree = [[] for _ in range(4 * times)]
+
+    def insert(node, left, right, start, end, edge):
+        if end <= left or right <= start:
+            return
+        if start <= left and right <= end:
+            tree[node].append(edge)
+            return
+        middle = (left + right) // 2
+        insert(2 * node, left, middle, start, end, edge)
+        insert(2 * node + 1, middle, right, start, end, edge)
+
+    for start, end, x, y in timeline:
+        insert(1, 0, times, start, end, (x, y))
+    return tree
+
+
+def solve_with_rollback(nodes: int, times: int, tree, queries):
+    uf = RollbackUnionFind(nodes)
+    answers = []
+
+    def visit(node, left, right):
+        token = uf.snapshot()
+        uf.unite_many(tree[node])
+        if right - left == 1:
+            answers.extend(uf.same(x, y) for x, y in queries[left])
+        else:
+            middle = (left + right) // 2
+            visit(2 * node, left, middle)
+            visit(2 * node + 1, middle, right)
+        uf.rollback(token)
+
+    visit(1, 0, times)
+    return answers
+
+
+def solve_with_copies(nodes: int, times: int, tree, queries):
+    answers = []
+
+    def visit(uf, node, left, right):
+        uf = deepcopy(uf)
+        uf.unite_many(tree[node])
+        if right - left == 1:
+            answers.extend(uf.same(x, y) for x, y in queries[left])
+        else:
+            middle = (left + right) // 2
+            visit(uf, 2 * node, left, middle)
+            visit(uf, 2 * node + 1, middle, right)
+
+    visit(RollbackUnionFind(nodes, compact=True), 1, 0, times)
+    return answers
+
+
+if __name__ == "__main__":
+    nodes, times, edges = 2_000, 256, 4_000
+    timeline, queries = generate(nodes, times, edges)
+    tree = segments(timeline, times)
+
+    start = perf_counter()
+    rollback = solve_with_rollback(nodes, times, tree, queries)
+    rolled = perf_counter()
+    copied = solve_with_copies(nodes, times, tree, queries)
+    finished = perf_counter()
+
+    assert rollback == copied, "rollback and copying disagree"
+    for time, pairs in enumerate(queries[:8]):
+        alive = [(x, y) for begin, end, x, y in timeline if begin <= time < end]
+        uf = RollbackUnionFind(nodes)
+        uf.unite_many(alive)
+        assert [uf.same(x, y) for x, y in pairs] == rollback[4 * time:4 * time + 4], f"wrong answer at t={time}"
+    print(f"{sum(rollback)}/{len(rollback)} queries connected")
+    print(f"rollback{(rolled - start) * 1e3:>12.1f} ms")
+    print(f"copying {(finished - rolled) * 1e3:>12.1f} ms")
@@ -0,0 +1,21 @@
+import io
+from timeit import timeit
+
+from zpy.operators import add, tap, tracer
+from zpy.sink import BufferedSink, PrintSink
+
+if __name__ == "__main__":
+    number = 100_000
+    stream = io.StringIO()
+    buffered = BufferedSink(PrintSink(stream), maxsize=1 << 16)
+    cases = {
+        "add(1)": add(1),
+        "add(1) / tap(print sink)": add(1) / tap(tracer(PrintSink(stream))),
+        "add(1) / tap(buffered sink)": add(1) / tap(tracer(buffered)),
+        "add(1) / tap(every_n=100)": add(1) / tap(tracer(buffered, every_n=100)),
+    }
+    for name, pipeline in cases.items():
+        elapsed = timeit(lambda: pipeline(1), number=number)
+        print(f"{name:<32}{elapsed / number * 1e9:>10.1f} ns/call")
+    buffered.close()
+    print(f"buffered sink dropped {buffered.dropped} records")
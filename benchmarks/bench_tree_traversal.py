@@ -0,0 +1,35 @@
+import tracemalloc
+from collections import deque
+from time import perf_counter
+
+from zpy.classes.bases.tree import Tree
+from zpy.classes.collections.graph.complete_binary_tree import CompleteBinaryTree
+
+TRAVERSALS = (
+    ("bfs", lambda tree: Tree.iter_bfs(tree), lambda tree: tree.iter_bfs()),
+    ("dfs pre", lambda tree: Tree.iter_dfs(tree, "pre"), lambda tree: tree.iter_dfs("pre")),
+    ("dfs post", lambda tree: Tree.iter_dfs(tree, "post"), lambda tree: tree.iter_dfs("post")),
+)
+
+
+def elapsed(traversal):
+    start = perf_counter()
+    deque(traversal, maxlen=0)
+    return perf_counter() - start
+
+
+def peak(traversal):
+    tracemalloc.start()
+    deque(traversal, maxlen=0)
+    _current, peak_ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_
+
+
+if __name__ == "__main__":
+    # tracemalloc slows every allocation down, so memory is measured on a smaller tree
+    timed, traced = CompleteBinaryTree(range(2 ** 20 - 1)), CompleteBinaryTree(range(2 ** 14 - 1))
+    for name, generic, index in TRAVERSALS:
+        for kind, traversal in (("generic", generic), ("index", index)):
+            print(f"{name:<9}{kind:<9}{elapsed(traversal(timed)) * 1e3:>10.1f} ms"
+                  f"{peak(traversal(traced)) / 1024:>12.1f} KiB peak")
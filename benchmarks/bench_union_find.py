@@ -0,0 +1,31 @@
+from random import Random
+from time import perf_counter
+
+from zpy.classes.collections.graph.union_find import UnionFind
+
+if __name__ == "__main__":
+    size = 10 ** 6
+    random = Random(0)
+    pairs = [(random.randrange(size), random.randrange(size)) for _ in range(size)]
+
+    for compact in (False, True):
+        mode = "compact" if compact else "default"
+
+        start = perf_counter()
+        uf = UnionFind(size, compact=compact)
+        for x, y in pairs:
+            uf.unite(x, y)
+        united = perf_counter()
+        same = sum(uf.same(x, y) for x, y in pairs)
+        queried = perf_counter()
+
+        bulk = UnionFind(size, compact=compact)
+        bulk.unite_many(pairs)
+        bulk_united = perf_counter()
+        labels = bulk.labels()
+        labelled = perf_counter()
+
+        print(f"{mode:<8} init + {len(pairs)} unite{(united - start) * 1e3:>10.1f} ms")
+        print(f"{mode:<8} {len(pairs)} same{(queried - united) * 1e3:>18.1f} ms  ({same} connected)")
+        print(f"{mode:<8} init + unite_many{(bulk_united - queried) * 1e3:>15.1f} ms")
+        print(f"{mode:<8} labels{(labelled - bulk_united) * 1e3:>25.1f} ms  ({len(set(labels))} components)")
@@ -0,0 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from zpy.classes.collections.array import Array
+from zpy.operators import add, mul
+
+
+class TestArray:
+    def test_fold_chunks(self):
+        assert Array(range(100)).fold_chunks(7, 0, add, add) == sum(range(100))
+
+    def test_chunks_rejects_non_positive(self):
+        with pytest.raises(ValueError):
+            list(Array.of(1, 2).chunks(0))
+
+    def test_par_map_default_process_pool(self):
+        array = Array(range(1000))
+        assert array.par_map(add(1) / mul(2), chunksize=100, threshold=10) == array.map(add(1) / mul(2))
+
+    def test_par_reduce_default_process_pool(self):
+        array = Array(range(1000))
+        assert array.par_reduce(0, add, add, chunksize=100, threshold=10) == sum(range(1000))
+
+    def test_par_map_explicit_executor(self):
+        array = Array(range(100))
+        with ThreadPoolExecutor(2) as executor:
+            assert array.par_map(lambda x: x * x, executor, chunksize=7, threshold=10) == array.map(lambda x: x * x)
+
+    def test_par_map_serial_below_threshold(self):
+        assert Array.of(1, 2).par_map(lambda x: x + 1) == Array.of(2, 3)
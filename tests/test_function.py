@@ -0,0 +1,229 @@
+import pickle
+from inspect import signature
+
+import pytest
+
+from zpy.classes.collections.cache import LRUCache, TTLCache
+from zpy.function import Function, CallPlan, Memoized, memoize
+from zpy.operators import add
+
+
+def positional(a, b, c):
+    return a, b, c
+
+
+def keyword_only(a, *, b, c=3):
+    return a, b, c
+
+
+def var_args(a, *args, **kwargs):
+    return a, args, kwargs
+
+
+def defaults(a, b=2, c=3):
+    return a, b, c
+
+
+@memoize(maxsize=4)
+def memoized_pow(base, exponent=2):
+    return base ** exponent
+
+
+def scaled_key(x, y):
+    return x * 10 + y
+
+
+class TestCallPlan:
+    def test_positional(self):
+        plan = CallPlan(signature(positional))
+        assert plan.arity == 3
+        assert plan.positional_only == 0
+        assert plan.keywords == {"a", "b", "c"}
+        assert not plan.var_args and not plan.var_kwargs
+        assert plan.direct
+
+    def test_keyword_only(self):
+        plan = CallPlan(signature(keyword_only))
+        assert plan.arity == 1
+        assert [param.name for param in plan.keyword_only] == ["b", "c"]
+        assert not plan.direct
+
+    def test_bind_missing(self):
+        plan = CallPlan(signature(keyword_only))
+        apply_args, apply_kwargs, missing, exceeding_args, exceeding_kwargs = plan.bind((1,), {})
+        assert apply_args == [1]
+        assert apply_kwargs == {}
+        assert [param.name for param in missing] == ["b"]
+        assert exceeding_args == [] and exceeding_kwargs == {}
+
+    def test_bind_var_args(self):
+        plan = CallPlan(signature(var_args))
+        apply_args, apply_kwargs, missing, exceeding_args, exceeding_kwargs = plan.bind((1, 2, 3), {"x": 4})
+        assert apply_args == [1, 2, 3]
+        assert apply_kwargs == {"x": 4}
+        assert not missing and not exceeding_args and not exceeding_kwargs
+
+    def test_bind_exceeding(self):
+        plan = CallPlan(signature(positional))
+        _args, _kwargs, missing, exceeding_args, exceeding_kwargs = plan.bind((1, 2, 3, 4), {"z": 5})
+        assert not missing
+        assert exceeding_args == [4]
+        assert exceeding_kwargs == {"z": 5}
+
+    def test_normalize_fills_defaults(self):
+        plan = CallPlan(signature(defaults))
+        assert plan.normalize([1], {}) == ((1, 2, 3), {})
+        assert plan.normalize([1], {"c": 4}) == ((1, 2, 4), {})
+        assert CallPlan(signature(keyword_only)).normalize([1], {"b": 2}) == ((1,), {"b": 2, "c": 3})
+
+    def test_remaining(self):
+        plan = CallPlan(signature(positional))
+        assert str(plan.remaining((1,), {})) == "(b, c)"
+        assert str(plan.remaining((), {"b": 2})) == "(a, *, c)"
+
+
+class TestCurry:
+    def test_positional(self):
+        f = Function(positional)
+        assert f(1)(2)(3) == (1, 2, 3)
+        assert f(1, 2)(3) == (1, 2, 3)
+        assert f(1)(2, 3) == (1, 2, 3)
+
+    def test_partial_is_flat(self):
+        f = Function(positional)
+        curried = f(1)(2)
+        assert curried.applied_args == (1, 2)
+        assert curried.f is positional
+        assert curried.call_plan is f.call_plan
+        assert str(curried.signature) == "(c)"
+
+    def test_keyword(self):
+        f = Function(positional)
+        assert f(c=3)(1)(2) == (1, 2, 3)
+        assert f(b=2)(1, c=3) == (1, 2, 3)
+
+    def test_keyword_only(self):
+        f = Function(keyword_only)
+        curried = f(1)
+        assert isinstance(curried, Function)
+        assert curried(b=2) == (1, 2, 3)
+        assert f(b=2)(1) == (1, 2, 3)
+        assert f(1, b=2, c=4) == (1, 2, 4)
+
+    def test_var_args(self):
+        f = Function(var_args)
+        assert f(1) == (1, (), {})
+        assert f(1, 2, 3, x=4) == (1, (2, 3), {"x": 4})
+
+    def test_defaults(self):
+        f = Function(defaults)
+        assert f(1) == (1, 2, 3)
+        assert f(1, c=5) == (1, 2, 5)
+
+    def test_exceeding_args_chain(self):
+        f = Function(lambda a: lambda b: a + b)
+        assert f(1, 2) == 3
+
+    def test_exceeding_args_ignored_warns(self):
+        f = Function(keyword_only)
+        with pytest.warns(RuntimeWarning):
+            curried = f(1, 2)
+        assert curried(b=5) == (1, 5, 3)
+
+    def test_pickle(self):
+        assert pickle.loads(pickle.dumps(add(1)))(2) == 3
+        assert pickle.loads(pickle.dumps(add / add(1)))(2)(3) == 6
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMemoize:
+    def test_hits_and_misses(self):
+        calls = []
+        f = memoize(lambda a, b: calls.append((a, b)) or a + b)
+        assert f(1, 2) == f(1, 2) == 3
+        assert calls == [(1, 2)]
+        assert (f.stats.hits, f.stats.misses) == (1, 1)
+
+    def test_curried_calls_share_entries(self):
+        calls = []
+        f = memoize(lambda a, b: calls.append((a, b)) or a + b)
+        assert f(1)(2) == f(1, 2) == f(b=2)(1) == 3
+        assert calls == [(1, 2)]
+        assert isinstance(f(1), Memoized)
+        assert f(1).cache is f.cache
+
+    def test_defaults_are_normalized(self):
+        calls = []
+        f = memoize(lambda a, b=2: calls.append((a, b)) or a + b)
+        assert f(1) == f(1, 2) == f(1, b=2) == 3
+        assert len(calls) == 1
+
+    def test_types_are_distinguished(self):
+        f = memoize(lambda a: type(a))
+        assert f(1) is int
+        assert f(1.0) is float
+        assert f(True) is bool
+
+    def test_unhashable_arguments_bypass_cache(self):
+        calls = []
+        f = memoize(lambda a: calls.append(a) or len(a))
+        assert f([1, 2]) == f([1, 2]) == 2
+        assert calls == [[1, 2], [1, 2]]
+        assert f.stats.misses == 2
+        assert f.stats.hits == 0
+
+    def test_custom_key(self):
+        calls = []
+        f = Function(lambda x, y: calls.append((x, y)) or x + y).memoize(key=scaled_key)
+        assert f(1, 2) == f(1, 2) == 3
+        assert len(calls) == 1
+
+    def test_lru_eviction(self):
+        f = memoize(lambda a: a, maxsize=2)
+        f(1), f(2), f(3)
+        assert f.stats.evictions == 1
+        assert len(f.cache) == 2
+
+    def test_ttl(self):
+        clock = Clock()
+        calls = []
+        f = Memoized(lambda a: calls.append(a) or a, cache=TTLCache(1.0, clock=clock))
+        f(1), f(1)
+        clock.now = 2.0
+        f(1)
+        assert calls == [1, 1]
+
+    def test_curry_binds_once(self):
+        f = memoize(lambda a, b: a + b)
+        bind = f.call_plan.bind
+        binds = []
+        f.call_plan.bind = lambda *args: binds.append(args) or bind(*args)
+        assert f(1)(2) == 3
+        assert len(binds) == 2
+
+    def test_pickle_registered(self):
+        assert pickle.loads(pickle.dumps(memoized_pow)) is memoized_pow
+        partial_pow = pickle.loads(pickle.dumps(memoized_pow(exponent=3)))
+        assert partial_pow(2) == 8
+        assert partial_pow.cache is memoized_pow.cache
+
+    def test_pickle_keeps_configuration(self):
+        f = Function(scaled_key).memoize(maxsize=7, key=scaled_key)
+        f(1, 2)
+        restored = pickle.loads(pickle.dumps(f))
+        assert isinstance(restored, Memoized)
+        assert restored.key is scaled_key
+        assert isinstance(restored.cache, LRUCache) and restored.cache.maxsize == 7
+        assert len(restored.cache) == 0
+        assert restored(1)(2) == 12
+
+    def test_pickle_ttl_cache(self):
+        restored = pickle.loads(pickle.dumps(Function(scaled_key).memoize(ttl=5.0)))
+        assert isinstance(restored.cache, TTLCache) and restored.cache.ttl == 5.0
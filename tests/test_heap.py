@@ -0,0 +1,155 @@
+import pickle
+import random
+
+import pytest
+
+from zpy.classes.collections.graph.dary_heap import DaryHeap
+from zpy.classes.collections.graph.heap import Heap
+from zpy.classes.collections.graph.pairing_heap import PairingHeap
+from zpy.classes.logical.maybe import Just, Nothing
+from zpy.operators import identity
+
+
+def drain(heap):
+    return [heap.pop() for _ in range(len(heap))]
+
+
+def assert_consistent(heap):
+    assert len(heap.keys) == len(heap.stable_order) == len(heap.positions) == len(heap)
+    assert all(heap.positions[order] == idx for idx, order in enumerate(heap.stable_order))
+    assert all(heap.key(item) == key for item, key in zip(heap, heap.keys))
+
+
+@pytest.mark.parametrize("cls", [Heap, DaryHeap])
+class TestHeap:
+    def test_sorted(self, cls):
+        items = random.Random(0).choices(range(50), k=200)
+        assert drain(cls(items)) == sorted(items)
+
+    def test_key_and_stability(self, cls):
+        items = [(1, "a"), (0, "b"), (1, "c"), (0, "d")]
+        assert drain(cls(items, key=lambda pair: pair[0])) == [(0, "b"), (0, "d"), (1, "a"), (1, "c")]
+
+    def test_decrease_key(self, cls):
+        heap = cls([5, 6, 7])
+        handle = heap.push(9)
+        heap.decrease_key(handle, 1)
+        assert heap.peek() == 1
+        with pytest.raises(ValueError):
+            heap.decrease_key(handle, 10)
+
+    def test_append_extend_keep_invariants(self, cls):
+        heap = cls([3, 1, 2])
+        heap.append(-5)
+        heap.extend([10, 0])
+        heap += [4]
+        assert_consistent(heap)
+        assert drain(heap) == [-5, 0, 1, 2, 3, 4, 10]
+
+    def test_remove_and_delitem(self, cls):
+        heap = cls(range(10))
+        heap.remove(4)
+        del heap[0]
+        last = heap[-1]
+        del heap[-1]
+        assert_consistent(heap)
+        assert drain(heap) == sorted(set(range(10)) - {0, 4, last})
+
+    def test_clear(self, cls):
+        heap = cls([3, 1])
+        heap.clear()
+        assert_consistent(heap)
+        heap.push(2)
+        assert drain(heap) == [2]
+
+    @pytest.mark.parametrize("mutate", [
+        lambda heap: heap.insert(0, 1),
+        lambda heap: heap.__setitem__(0, 1),
+        lambda heap: heap.sort(),
+        lambda heap: heap.reverse(),
+    ])
+    def test_positional_mutation_raises(self, cls, mutate):
+        with pytest.raises(TypeError):
+            mutate(cls([1, 2]))
+
+    def test_map_filter_keep_key(self, cls):
+        heap = cls([1, 2, 3, 4], key=lambda x: -x)
+        assert drain(heap.map(lambda x: x * 10)) == [40, 30, 20, 10]
+        assert drain(heap.filter(lambda x: x % 2)) == [3, 1]
+
+    def test_map_with_new_key(self, cls):
+        heap = cls([1, 2, 3], key=lambda x: -x)
+        assert drain(heap.map(str, key=identity)) == ["1", "2", "3"]
+
+    def test_product_and_flat_map_drop_key(self, cls):
+        heap = cls([3, 1, 2], key=lambda x: -x)
+        assert drain(heap.product([7])) == [(1, 7), (2, 7), (3, 7)]
+        assert drain(heap.flat_map(lambda x: [(x,)])) == [(1,), (2,), (3,)]
+
+    def test_pickle(self, cls):
+        heap = cls([5, 3, 8, 1])
+        restored = pickle.loads(pickle.dumps(heap))
+        assert type(restored) is cls
+        assert_consistent(restored)
+        assert drain(restored) == [1, 3, 5, 8]
+
+
+def test_dary_map_keeps_arity():
+    assert DaryHeap([1, 2, 3], d=3).map(lambda x: x + 1).arity == 3
+
+
+class TestDaryHeapSibling:
+    def test_ternary(self):
+        heap = DaryHeap(range(6), d=3)
+        assert heap.sibling(0) == Nothing()
+        assert heap.sibling(1) == Just(heap[2])
+        assert heap.sibling(2) == Just(heap[3])
+        assert heap.sibling(3) == Just(heap[2])
+        assert heap.sibling(4) == Just(heap[5])
+        assert heap.sibling(5) == Just(heap[4])
+
+    def test_only_child(self):
+        assert DaryHeap(range(5), d=3).sibling(4) == Nothing()
+
+    def test_binary_matches_complete_binary_tree(self):
+        dary, binary = DaryHeap(range(10), d=2), Heap(range(10))
+        assert [dary.sibling(idx) for idx in range(10)] == [binary.sibling(idx) for idx in range(10)]
+
+
+class TestPairingHeap:
+    def test_sorted_and_stable(self):
+        items = [(1, "a"), (0, "b"), (1, "c"), (0, "d")]
+        heap = PairingHeap(items, key=lambda pair: pair[0])
+        assert drain(heap) == [(0, "b"), (0, "d"), (1, "a"), (1, "c")]
+
+    def test_storage_is_reused(self):
+        heap = PairingHeap()
+        for round_ in range(100):
+            for item in range(10):
+                heap.push((round_, item))
+            assert drain(heap) == [(round_, item) for item in range(10)]
+        assert len(heap.items) == 10
+
+    def test_stability_survives_slot_reuse(self):
+        heap = PairingHeap(key=lambda pair: pair[0])
+        heap.push((0, "first"))
+        heap.push((1, "old"))
+        heap.pop()
+        heap.push((1, "new"))
+        assert drain(heap) == [(1, "old"), (1, "new")]
+
+    def test_decrease_key_after_reuse(self):
+        heap = PairingHeap([5, 6, 7])
+        heap.pop()
+        handle = heap.push(9)
+        heap.decrease_key(handle, 1)
+        assert drain(heap) == [1, 6, 7]
+
+    def test_stale_handle_raises(self):
+        heap = PairingHeap()
+        handle = heap.push(9)
+        drain(heap)
+        heap.push(100)
+        with pytest.raises(KeyError):
+            heap.decrease_key(handle, 1)
+        assert drain(heap) == [100]
@@ -0,0 +1,69 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from zpy.classes.collections.ndarray import NdArray
+from zpy.operators import add, mul, eq, lt, pow
+
+
+class TestNdArray:
+    def test_map_vectorized(self):
+        assert NdArray.of(1, 2, 3).map(add(1) / mul(2)) == NdArray.of(3, 5, 7)
+
+    def test_map_mixed_return_types(self):
+        mapped = NdArray.of(1, 2, 3).map(lambda x: x if x == 1 else 0.5)
+        assert mapped.values.tolist() == [1, 0.5, 0.5]
+
+    def test_map_keeps_unrelated_types_apart(self):
+        mapped = NdArray.of(1, 2).map(lambda x: "a" if x == 1 else x)
+        assert mapped.values.tolist() == ["a", 2]
+
+    def test_map_calls_once_with_python_values(self):
+        seen = []
+
+        def f(x):
+            seen.append(x)
+            return x
+
+        NdArray.of(1, 2, 3).map(f)
+        assert seen == [1, 2, 3]
+        assert all(type(x) is int for x in seen)
+
+    def test_map_tuples(self):
+        assert NdArray.of(1, 2).map(lambda x: (x, x)).values.tolist() == [(1, 1), (2, 2)]
+
+    def test_product_numeric(self):
+        product = NdArray.of(1, 2).product(NdArray.of(3, 4))
+        assert product.values.tolist() == [(1, 3), (1, 4), (2, 3), (2, 4)]
+        with pytest.raises(TypeError):
+            product.map(add(1))
+
+    def test_product_mixed_dtypes(self):
+        product = NdArray.of(1, 2).product(["a", "b"])
+        assert product.values.tolist() == [(1, "a"), (1, "b"), (2, "a"), (2, "b")]
+
+    def test_product_does_not_cast(self):
+        product = NdArray.of(1, 2).product(NdArray.of(0.5))
+        assert product.values.tolist() == [(1, 0.5), (2, 0.5)]
+
+    def test_reduce(self):
+        assert NdArray(range(10)).reduce(0, add) == 45
+        assert NdArray(range(10)).reduce(0, lambda x, y: x + y) == 45
+
+    def test_reduce_falls_back(self):
+        assert NdArray.of(1, 1).reduce(True, eq) is True
+        assert NdArray.of(1, 1).reduce(0, lt) is False
+        assert NdArray(["a", "b"]).reduce("", add) == "ab"
+
+    def test_reduce_empty_returns_initial(self):
+        initial = NdArray().reduce(0, add)
+        assert initial == 0 and type(initial) is int
+
+    def test_map_ufunc_falls_back(self):
+        assert (pow(2) / NdArray.of(-1, 2)).values.tolist() == [0.5, 4]
+
+    def test_apply_outer(self):
+        assert (add / NdArray.of(1, 2)).apply(NdArray.of(10, 20)) == NdArray.of(11, 21, 12, 22)
+
+    def test_filter(self):
+        assert NdArray(range(6)).filter(lambda x: x % 2 == 0) == NdArray.of(0, 2, 4)
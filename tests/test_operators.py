@@ -0,0 +1,72 @@
+import subprocess
+import sys
+
+import pytest
+
+import zpy.operators as operators
+from benchmarks.bench_import import BUDGET_US, MODULE, import_times
+from zpy.function import Function
+
+
+def run(code: str):
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestLazyOperators:
+    def test_wrappers_built_on_first_access(self):
+        run(
+            "import zpy.operators as o\n"
+            "assert 'add' not in vars(o)\n"
+            "add = o.add\n"
+            "assert vars(o)['add'] is add and o.add is add\n"
+        )
+
+    def test_signature_deferred_until_call(self):
+        run(
+            "import zpy.operators as o\n"
+            "assert 'call_plan' not in vars(o.identity)\n"
+            "o.identity(1)\n"
+            "assert 'call_plan' in vars(o.identity)\n"
+        )
+
+    def test_aliases_share_wrapper(self):
+        assert operators.invert is operators.inv
+        assert operators.indexOf is operators.index_of
+        assert operators.countOf is operators.count_of
+
+    def test_wrappers(self):
+        assert isinstance(operators.add, Function)
+        assert operators.add(1)(2) == 3
+        assert operators.pow(2, 3) == 8
+        assert operators.methodcaller("upper")("a") == "A"
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            getattr(operators, "no_such_operator")
+
+    def test_dir_lists_lazy_names(self):
+        assert {"add", "invert", "map"} <= set(dir(operators))
+
+
+class TestAll:
+    def test_public_names_only(self):
+        assert {"map", "compose", "tap", "trace", "add", "invert", "itemgetter"} <= set(operators.__all__)
+        internals = {"op", "T", "U", "V", "unary", "binary", "default_tracer", "builtin_map", "Function", "Signature"}
+        assert not internals & set(operators.__all__)
+        assert not [name for name in operators.__all__ if name.startswith("_")]
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from zpy.operators import *", namespace)
+        assert namespace["add"] is operators.add
+        assert "op" not in namespace and "builtin_map" not in namespace
+
+
+def test_import_time_budget():
+    import_times(MODULE)
+    runs = [import_times(MODULE) for _ in range(3)]
+    best = min(
+        sum(self_us for name, (self_us, _cumulative_us) in times.items() if name.split(".")[0] == "zpy")
+        for times in runs
+    )
+    assert best <= BUDGET_US, f"importing {MODULE} spends {best} us in zpy modules"
@@ -0,0 +1,95 @@
+import json
+import threading
+from pstats import Stats
+
+import pytest
+
+from zpy.function import Function, memoize
+from zpy.operators import add, mul
+from zpy.profiler import Profiler
+
+
+class Delegating(Function):
+    def __call__(self, *args, **kwargs):
+        return super().__call__(*args, **kwargs)
+
+
+def pair(a, b):
+    return a, b
+
+
+class TestProfiler:
+    def test_counts_calls_and_partials(self):
+        with Profiler() as profiler:
+            add(1, 2)
+            add(1)(2)
+        records = profiler.to_dict()
+        assert records["add"]["calls"] == 2
+        assert records["add"]["partials"] == 1
+        assert records["add(1)"]["calls"] == 1
+
+    def test_composition_stages_are_attributed(self):
+        pipeline = add(1) / mul(2)
+        with Profiler() as profiler:
+            assert pipeline(3) == 7
+        records = profiler.to_dict()
+        assert records["add(1) / mul(2)"]["calls"] == 1
+        assert records["add(1)"]["calls"] == records["mul(2)"]["calls"] == 1
+        outer = records["add(1) / mul(2)"]
+        assert outer["cumulative"] >= outer["self_time"]
+
+    def test_disabled_restores_originals(self):
+        call, curry = Function.__dict__["__call__"], Function.__dict__["curry"]
+        with Profiler():
+            assert Function.__dict__["__call__"] is not call
+        assert Function.__dict__["__call__"] is call
+        assert Function.__dict__["curry"] is curry
+
+    def test_memoized_partial_counted_once(self):
+        f = memoize(pair)
+        with Profiler() as profiler:
+            f(1)(2)
+        records = profiler.to_dict()
+        assert records["pair"] == {**records["pair"], "calls": 1, "partials": 1}
+        assert records["pair(1)"]["calls"] == 1
+
+    def test_super_call_counted_once(self):
+        f = Delegating(pair)
+        with Profiler() as profiler:
+            f(1, 2)
+            f(1)(2)
+        records = profiler.to_dict()
+        assert records["pair"]["calls"] == 2
+        assert records["pair(1)"]["calls"] == 1
+
+    def test_recursion_counts_every_call(self):
+        @Function
+        def countdown(n):
+            return n if n == 0 else countdown(n - 1)
+
+        with Profiler() as profiler:
+            countdown(3)
+        assert profiler.to_dict()["countdown"]["calls"] == 4
+
+    def test_only_one_profiler(self):
+        with Profiler():
+            with pytest.raises(RuntimeError):
+                Profiler().enable()
+
+    def test_records_other_threads(self):
+        with Profiler() as profiler:
+            threads = [threading.Thread(target=lambda: [add(1, 2) for _ in range(100)]) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert profiler.to_dict()["add"]["calls"] == 400
+
+    def test_exports(self, tmp_path):
+        with Profiler() as profiler:
+            add(1, 2)
+        assert json.loads(profiler.to_json())["add"]["calls"] == 1
+        stats = profiler.to_pstats()
+        assert stats.total_calls == 1
+        profiler.dump_stats(str(tmp_path / "out.prof"))
+        assert Stats(str(tmp_path / "out.prof")).total_calls == 1
@@ -0,0 +1,39 @@
+import asyncio
+
+from zpy.classes.collections.array import Array
+from zpy.classes.collections.async_array import AsyncArray
+from zpy.classes.collections.stream import Stream
+from zpy.operators import add, mul
+
+
+class TestStream:
+    def test_matches_array(self):
+        stream = Stream(range(10)).map(add(1)).filter(lambda x: x % 2).flat_map(lambda x: (x, x))
+        assert stream.to_array() == Array(range(1, 11)).filter(lambda x: x % 2).flat_map(lambda x: (x, x))
+
+    def test_product_with_generator(self):
+        product = Stream.of(1, 2).product(x for x in "ab")
+        assert product.to_array() == Array([(1, "a"), (1, "b"), (2, "a"), (2, "b")])
+        assert product.to_array() == Array([(1, "a"), (1, "b"), (2, "a"), (2, "b")])
+
+    def test_apply_with_generator(self):
+        applied = Stream.of(add(1), mul(2)).apply(x for x in (1, 2))
+        assert applied.to_array() == Array([2, 3, 2, 4])
+
+    def test_reiterable_source(self):
+        stream = Stream(range(3)).map(add(1))
+        assert stream.to_array() == stream.to_array() == Array([1, 2, 3])
+
+    def test_generator_source_is_single_pass(self):
+        stream = Stream(x for x in range(3))
+        assert stream.to_array() == Array([0, 1, 2])
+        assert stream.to_array() == Array()
+
+    def test_fold_chunks(self):
+        assert Stream(range(100)).fold_chunks(7, 0, add, add) == sum(range(100))
+
+
+class TestAsyncArray:
+    def test_apply_with_generator(self):
+        applied = asyncio.run(AsyncArray.of(add(1), mul(2)).apply(x for x in (1, 2)))
+        assert applied == [2, 3, 2, 4]
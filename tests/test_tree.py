@@ -0,0 +1,58 @@
+import io
+
+from zpy.classes.collections.graph.complete_binary_tree import CompleteBinaryTree
+from zpy.classes.collections.graph.dary_heap import DaryHeap
+from zpy.classes.collections.graph.union_find import UnionFind
+from zpy.operators import pretty
+
+
+class TestPretty:
+    def test_complete_binary_tree(self):
+        assert pretty(CompleteBinaryTree(range(7))) == "\n".join([
+            "0╶┬╴1╶┬╴3",
+            "  │   └╴4",
+            "  └╴2╶┬╴5",
+            "      └╴6",
+        ])
+
+    def test_uneven_depth_pads_columns(self):
+        assert pretty(CompleteBinaryTree(range(10))) == "\n".join([
+            "0╶┬╴1╶┬╴3╶┬╴7",
+            "  │   │   └╴8",
+            "  │   └╴4╶─╴9",
+            "  └╴2╶┬╴5    ",
+            "      └╴6    ",
+        ])
+
+    def test_forest(self):
+        uf = UnionFind(5)
+        uf.unite(0, 1)
+        uf.unite(2, 3)
+        assert pretty(uf) == "0╶─╴1\n2╶─╴3\n4"
+
+    def test_empty(self):
+        assert pretty(CompleteBinaryTree()) == ""
+
+    def test_max_depth(self):
+        assert list(CompleteBinaryTree(range(7)).iter_pretty(max_depth=1)) == ["0╶┬╴1╶─╴…", "  └╴2╶─╴…"]
+
+    def test_max_children(self):
+        assert list(DaryHeap(range(13), d=4).iter_pretty(max_children=2)) == [
+            "0╶┬╴1╶┬╴ 5",
+            "  │   ├╴ 6",
+            "  │   └╴ …",
+            "  ├╴2╶┬╴ 9",
+            "  │   ├╴10",
+            "  │   └╴ …",
+            "  └╴…     ",
+        ]
+
+    def test_write_pretty_streams_lines(self):
+        tree = CompleteBinaryTree(range(7))
+        file = io.StringIO()
+        tree.write_pretty(file)
+        assert file.getvalue() == pretty(tree) + "\n"
+
+    def test_large_tree_is_streamed(self):
+        lines = CompleteBinaryTree(range(1 << 15)).iter_pretty()
+        assert next(lines).startswith("0╶┬╴1╶┬╴3")
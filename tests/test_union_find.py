@@ -0,0 +1,54 @@
+import pytest
+
+from benchmarks.bench_rollback_union_find import generate, segments, solve_with_rollback, solve_with_copies
+from zpy.classes.collections.graph.rollback_union_find import RollbackUnionFind
+from zpy.classes.collections.graph.union_find import UnionFind
+
+
+@pytest.mark.parametrize("compact", [False, True])
+class TestUnionFind:
+    def test_unite_same(self, compact):
+        uf = UnionFind(6, compact=compact)
+        uf.unite(0, 1)
+        uf.unite_many([(2, 3), (1, 3)])
+        assert uf.same(0, 2)
+        assert not uf.same(0, 4)
+        assert uf.size(0) == 4
+        assert uf.same_many([(0, 3), (4, 5)]) == [True, False]
+        assert list(uf.labels()) == [0, 0, 0, 0, 1, 2]
+        assert uf.roots == {uf.root(0), 4, 5}
+
+
+@pytest.mark.parametrize("compact", [False, True])
+class TestRollbackUnionFind:
+    def test_rollback(self, compact):
+        uf = RollbackUnionFind(5, compact=compact)
+        uf.unite(0, 1)
+        token = uf.snapshot()
+        uf.unite(1, 2)
+        uf.unite(3, 4)
+        assert uf.same(0, 2) and uf.same(3, 4)
+        uf.rollback(token)
+        assert uf.same(0, 1)
+        assert not uf.same(0, 2) and not uf.same(3, 4)
+        assert uf.size(0) == 2
+        assert uf.roots == {uf.root(0), 2, 3, 4}
+
+    def test_invalid_token(self, compact):
+        with pytest.raises(ValueError):
+            RollbackUnionFind(2, compact=compact).rollback(1)
+
+
+def test_offline_connectivity():
+    nodes, times, edges = 60, 32, 120
+    timeline, queries = generate(nodes, times, edges, seed=1)
+    tree = segments(timeline, times)
+    answers = solve_with_rollback(nodes, times, tree, queries)
+    assert answers == solve_with_copies(nodes, times, tree, queries)
+    expected = []
+    for time, pairs in enumerate(queries):
+        uf = UnionFind(nodes)
+        uf.unite_many([(x, y) for start, end, x, y in timeline if start <= time < end])
+        expected.extend(uf.same(x, y) for x, y in pairs)
+    assert answers == expected
+    assert any(answers) and not all(answers)
@@ -7,6 +7,8 @@ V = TypeVar("V")
 
 
 class Functor(Generic[T], ABC):
+    __slots__ = ()
+
     @abstractmethod
     def map(self, f: Callable[[T], U]) -> "Functor[U]":
         ...
@@ -16,12 +18,16 @@ class Functor(Generic[T], ABC):
 
 
 class Cartesian(Generic[T], ABC):
+    __slots__ = ()
+
     @abstractmethod
     def product(self, f: "Cartesian[U]") -> "Cartesian[Tuple[T, U]]":
         ...
 
 
 class Apply(Functor[T], ABC):
+    __slots__ = ()
+
     @abstractmethod
     def map(self, f: Callable[[T], U]) -> "Apply[U]":
         ...
@@ -38,6 +44,8 @@ class Apply(Functor[T], ABC):
     
 
 class Applicative(Apply[T], ABC):
+    __slots__ = ()
+
     @abstractmethod
     def map(self, f: Callable[[T], U]) -> "Applicative[U]":
         ...
@@ -2,12 +2,11 @@ from abc import ABC, abstractmethod
 from collections import deque
 from dataclasses import dataclass
 from enum import IntFlag
-from typing import Generic, Callable, List, TypeVar, Iterable
+from typing import Generic, Callable, List, TypeVar, Iterable, Iterator, Tuple, TextIO, Deque
 
 from zpy.classes.bases.utility.pretty import Pretty
 from zpy.classes.collections.array import Array
 from zpy.classes.logical.maybe import Maybe
-from zpy.operators import const
 
 
 T = TypeVar("T")
@@ -15,6 +14,7 @@ T = TypeVar("T")
 
 @dataclass
 class TraverseState(Generic[T]):
+    __slots__ = ("index", "item", "depth")
     index: int
     item: T
     depth: int
@@ -88,98 +88,126 @@ class Tree(Generic[T], Pretty, ABC):
     def __getitem__(self, idx: int) -> T:
         ...
 
-    def bfs(self, check: Callable[[TraverseState[T]], bool] = const(True)):
+    def has(self, idx: int) -> bool:
+        return bool(self.get(idx))
+
+    def get_or(self, idx: int, default: T) -> T:
+        if self.has(idx):
+            return self[idx]
+        return default
+
+    def iter_bfs(self) -> Iterator[TraverseState[T]]:
         if not self.root():
             return
-        root = self.root_idx()
-        queue = deque([root])
-        depth_queue = deque([0])
+        queue = deque([(self.root_idx(), 0)])
         while queue:
-            current = queue.popleft()
-            depth = depth_queue.popleft()
-            state = TraverseState(index=current, item=self[current], depth=depth)
-            if not check(state):
-                return state
+            current, depth = queue.popleft()
+            yield TraverseState(index=current, item=self[current], depth=depth)
             for child in self.children_idx(current):
-                if not self.get(child):
-                    continue
-                queue.append(child)
-                depth_queue.append(depth + 1)
+                if self.has(child):
+                    queue.append((child, depth + 1))
 
-    def dfs(self, check: Callable[[TraverseState[T]], bool] = const(True)):
+    def iter_dfs(self, order: str = "pre") -> Iterator[TraverseState[T]]:
+        if order not in ("pre", "post"):
+            raise ValueError(f"unknown traverse order: {order}")
         if not self.root():
             return
+        stack = [(self.root_idx(), 0, False)]
+        while stack:
+            current, depth, expanded = stack.pop()
+            if order == "post" and expanded:
+                yield TraverseState(index=current, item=self[current], depth=depth)
+                continue
+            if order == "pre":
+                yield TraverseState(index=current, item=self[current], depth=depth)
+            else:
+                stack.append((current, depth, True))
+            children = [child for child in self.children_idx(current) if self.has(child)]
+            stack.extend((child, depth + 1, False) for child in reversed(children))
+
+    def bfs(self, check: Callable[[TraverseState[T]], bool] = lambda _state: True):
+        for state in self.iter_bfs():
+            if not check(state):
+                return state
 
-        def traverse(idx: int, depth=0):
-            state = TraverseState(index=idx, item=self[idx], depth=depth)
+    def dfs(self, check: Callable[[TraverseState[T]], bool] = lambda _state: True, order: str = "pre"):
+        for state in self.iter_dfs(order):
             if check(state):
-                print(state)
                 return state
-            for child in self.children_idx(idx):
-                if not self.get(child):
-                    continue
-                traverse(child, depth + 1)
 
-        return traverse(self.root_idx())
+    def iter_pretty_rows(self, max_depth: int = None, max_children: int = None) \
+            -> Iterator[Tuple[int, List[BoxPart], List[str]]]:
+        if not self.root():
+            return
+
+        def children(idx: int, depth: int) -> List[int]:
+            if idx is Ellipsis:
+                return []
+            kids = [child for child in self.children_idx(idx) if self.has(child)]
+            if kids and max_depth is not None and depth >= max_depth:
+                return [Ellipsis]
+            if max_children is not None and len(kids) > max_children:
+                return kids[:max_children] + [Ellipsis]
+            return kids
+
+        def label(idx: int) -> str:
+            return "…" if idx is Ellipsis else repr(self[idx])
+
+        pending: List[Deque[int]] = [deque()]
+        start, node, edge = 0, self.root_idx(), BoxPart.EMPTY
+        while True:
+            edges = [
+                BoxPart.TOP | BoxPart.BOTTOM if pending[depth] else BoxPart.EMPTY
+                for depth in range(1, start)
+            ]
+            labels = []
+            depth = start
+            while True:
+                if depth:
+                    edges.append(edge)
+                labels.append(label(node))
+                kids = children(node, depth)
+                if not kids:
+                    break
+                depth += 1
+                del pending[depth:]
+                pending.append(deque(kids[1:]))
+                edge = BoxPart.LEFT | BoxPart.RIGHT | (BoxPart.BOTTOM if pending[depth] else BoxPart.EMPTY)
+                node = kids[0]
+            yield start, edges, labels
+            start = next((depth for depth in range(len(pending) - 1, 0, -1) if pending[depth]), 0)
+            if not start:
+                return
+            del pending[start + 1:]
+            node = pending[start].popleft()
+            edge = BoxPart.TOP | BoxPart.RIGHT | (BoxPart.BOTTOM if pending[start] else BoxPart.EMPTY)
+
+    def iter_pretty(self, max_depth: int = None, max_children: int = None) -> Iterator[str]:
+        widths: List[int] = []
+        for start, _edges, labels in self.iter_pretty_rows(max_depth, max_children):
+            for depth, text in enumerate(labels, start):
+                if depth == len(widths):
+                    widths.append(0)
+                widths[depth] = max(widths[depth], len(text))
+        for start, edges, labels in self.iter_pretty_rows(max_depth, max_children):
+            cells = [""] * start + labels + [""] * (len(widths) - start - len(labels))
+            edges = edges + [BoxPart.EMPTY] * (len(widths) - 1 - len(edges))
+            line = [cells[0].rjust(widths[0])]
+            for depth in range(1, len(widths)):
+                edge = edges[depth - 1]
+                line.append(str(BoxPart.RIGHT if edge & BoxPart.LEFT else BoxPart.EMPTY))
+                line.append(str(edge))
+                line.append(str(BoxPart.LEFT if edge & BoxPart.RIGHT else BoxPart.EMPTY))
+                line.append(cells[depth].rjust(widths[depth]))
+            yield "".join(line)
+
+    def write_pretty(self, file: TextIO, max_depth: int = None, max_children: int = None):
+        for line in self.iter_pretty(max_depth, max_children):
+            file.write(line)
+            file.write("\n")
 
     def __pretty__(self):
-        cols: List[List[str]] = []
-        edges: List[List[BoxPart]] = []
-
-        def action(state: TraverseState[T]):
-            if state.depth == len(cols):
-                cols.append([])
-            for _ in range(len(cols[state.depth]), len(cols[0])-1):
-                cols[state.depth].append("")
-            if state.depth - 1 == len(edges):
-                edges.append([])
-            if edges:
-                for _ in range(len(edges[state.depth-1]), len(edges[0])-1):
-                    edges[state.depth-1].append(BoxPart.EMPTY)
-            cols[state.depth].append(repr(state.item))
-            if self.parent(state.index):
-                edges[state.depth - 1].append(BoxPart.RIGHT)
-            if self.parent(state.index) and self.children_idx(self.parent_idx(state.index))[0] == state.index:
-                edges[state.depth - 1][-1] |= BoxPart.LEFT
-                return False
-            elif self.parent(state.index):
-                edges[state.depth - 1][-1] |= BoxPart.TOP
-                edges_len = len(edges[state.depth - 1])
-                for i in range(edges_len-2, -1, -1):
-                    edges[state.depth - 1][i] |= BoxPart.BOTTOM
-                    if edges[state.depth - 1][i] & BoxPart.LEFT:
-                        break
-                    else:
-                        edges[state.depth - 1][i] |= BoxPart.TOP
-            for i in range(state.depth):
-                cols[i].append("")
-            for i in range(state.depth-1):
-                edges[i].append(BoxPart.EMPTY)
-            return False
-
-        self.dfs(action)
-        if not cols:
-            print()
-            return
-        for col in cols[1:]:
-            col += [""] * (len(cols[0]) - len(col))
-        for edge in edges:
-            edge += [BoxPart.EMPTY] * (len(cols[0]) - len(edge))
-
-        col_widths = [
-            max(map(len, col))
-            for col in cols
-        ]
-        result = ""
-        for y, row in enumerate(zip(*cols)):
-            for x, col in enumerate(row):
-                if x > 0:
-                    result += str(BoxPart.RIGHT if edges[x-1][y] & BoxPart.LEFT else BoxPart.EMPTY)
-                    result += str(edges[x-1][y])
-                    result += str(BoxPart.LEFT if edges[x - 1][y] & BoxPart.RIGHT else BoxPart.EMPTY)
-                result += f"{{:>{col_widths[x]}}}".format(col)
-            result += "\n"
-        return result[:-1]
+        return "\n".join(self.iter_pretty())
 
 
 class Forest(Generic[T], Pretty, ABC):
@@ -187,5 +215,14 @@ class Forest(Generic[T], Pretty, ABC):
     def trees(self) -> Iterable[Tree[T]]:
         ...
 
+    def iter_pretty(self, max_depth: int = None, max_children: int = None) -> Iterator[str]:
+        for tree in self.trees():
+            yield from tree.iter_pretty(max_depth, max_children)
+
+    def write_pretty(self, file: TextIO, max_depth: int = None, max_children: int = None):
+        for line in self.iter_pretty(max_depth, max_children):
+            file.write(line)
+            file.write("\n")
+
     def __pretty__(self):
-        return "\n".join(map(lambda tree: type(tree).__pretty__(tree), self.trees()))
+        return "\n".join(self.iter_pretty())
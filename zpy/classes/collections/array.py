@@ -1,9 +1,10 @@
-from itertools import chain
-from typing import Iterable, Callable, cast, Tuple, TypeVar
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import chain, repeat
+from typing import Iterable, Iterator, Callable, cast, Tuple, TypeVar
 
 from zpy.classes.bases import Applicative, Cartesian
 from zpy.classes.logical.maybe import Maybe, Nothing, Just
-from zpy.operators import builtin_map, builtin_product, builtin_reduce
+from zpy.operators import builtin_map, builtin_filter, builtin_product, builtin_reduce
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -21,13 +22,33 @@ class Array(Applicative[T], Cartesian[T], list):
     def of(cls, *args):
         return cls(args)
 
+    def similar(self, iter_: Iterable[U]) -> "Array[U]":
+        """Build a collection like this one; map, par_map and filter go through it, product and flat_map don't."""
+        return type(self)(iter_)
+
     def map(self, f: Callable[[T], U]) -> "Array[U]":
-        cls = type(self)
-        return cls(builtin_map(f, self))
+        return self.similar(builtin_map(f, self))
+
+    def par_map(self, f: Callable[[T], U], executor: Executor = None, chunksize: int = 4096,
+                threshold: int = 8192) -> "Array[U]":
+        """Map in chunks on ``executor``; the default process pool needs ``f`` and the items to be picklable."""
+        if len(self) < threshold:
+            return self.map(f)
+        if executor is None:
+            with ProcessPoolExecutor() as executor:
+                return self.par_map(f, executor, chunksize, threshold)
+        results = executor.map(Array.map, self.chunks(chunksize), repeat(f))
+        return self.similar(chain.from_iterable(results))
+
+    def filter(self, f: Callable[[T], bool]) -> "Array[T]":
+        return self.similar(builtin_filter(f, self))
 
     def flat_map(self, f: Callable[[T], Iterable[U]]) -> "Array[U]":
         cls = type(self)
-        return self.reduce(cls(), lambda a, item: cls(chain(a, f(item))))
+        return cls(self.iter_flat_map(f))
+
+    def iter_flat_map(self, f: Callable[[T], Iterable[U]]) -> Iterator[U]:
+        return chain.from_iterable(builtin_map(f, self))
 
     def product(self, f: "Array[U]") -> "Array[Tuple[T, U]]":
         cls = type(self)
@@ -36,8 +57,30 @@ class Array(Applicative[T], Cartesian[T], list):
     def reduce(self, i: U, f: Callable[[U, T], U]) -> U:
         return builtin_reduce(f, self, i)
 
+    def fold_chunks(self, size: int, i: U, f: Callable[[U, T], U], combine: Callable[[U, U], U]) -> U:
+        return builtin_reduce(combine, (builtin_reduce(f, chunk, i) for chunk in self.chunks(size)), i)
+
+    def par_reduce(self, i: U, f: Callable[[U, T], U], combine: Callable[[U, U], U], executor: Executor = None,
+                   chunksize: int = 4096, threshold: int = 8192) -> U:
+        """Fold chunks on ``executor``; the default process pool needs ``f``, ``i`` and the items to be picklable."""
+        if len(self) < threshold:
+            return self.fold_chunks(chunksize, i, f, combine)
+        if executor is None:
+            with ProcessPoolExecutor() as executor:
+                return self.par_reduce(i, f, combine, executor, chunksize, threshold)
+        results = executor.map(builtin_reduce, repeat(f), self.chunks(chunksize), repeat(i))
+        return builtin_reduce(combine, results, i)
+
+    def chunks(self, size: int) -> Iterator["Array[T]"]:
+        if size <= 0:
+            raise ValueError(f"chunk size must be positive: {size}")
+        return (Array(list.__getitem__(self, slice(start, start + size))) for start in range(0, len(self), size))
+
     def apply(self: "Array[Callable[[T], U]]", ft: "Array[T]") -> "Array[U]":
-        return self.reduce(Array(), lambda a, f: Array(chain(a, ft.map(lambda t: f(t)))))
+        return Array(self.iter_apply(ft))
+
+    def iter_apply(self: "Array[Callable[[T], U]]", ft: "Array[T]") -> Iterator[U]:
+        return chain.from_iterable(builtin_map(lambda f: builtin_map(f, ft), self))
 
     def __repr__(self):
         return f"{type(self).__name__}({super().__repr__()})"
@@ -47,6 +90,14 @@ class Array(Applicative[T], Cartesian[T], list):
             return Nothing()
         return Just(self[idx])
 
+    def has(self, idx: int) -> bool:
+        return -len(self) <= idx < len(self)
+
+    def get_or(self, idx: int, default: T) -> T:
+        if self.has(idx):
+            return list.__getitem__(self, idx)
+        return default
+
     def __getitem__(self, item) -> T:
         return list.__getitem__(self, item)
 
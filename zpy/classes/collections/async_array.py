@@ -0,0 +1,74 @@
+from asyncio import Semaphore, gather
+from inspect import isawaitable
+from itertools import chain
+from typing import Iterable, Callable, Tuple, TypeVar, Awaitable, Union
+
+from zpy.classes.bases import Applicative
+from zpy.classes.collections.array import Array
+from zpy.operators import builtin_map
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+MaybeAwaitable = Union[U, Awaitable[U]]
+
+
+class AsyncArray(Applicative[T], list):
+    def __new__(cls, iter_: Iterable[T] = (), limit: int = 64):
+        return list.__new__(cls, iter_)
+
+    def __init__(self, iter_: Iterable[T] = (), limit: int = 64):
+        super().__init__(iter_)
+        self.limit = limit
+
+    @classmethod
+    def pure(cls, m: T) -> "AsyncArray[T]":
+        return cls([m])
+
+    @classmethod
+    def of(cls, *args):
+        return cls(args)
+
+    async def gather(self, f: Callable[[T], MaybeAwaitable[U]], items: Iterable[T]) -> Tuple[U, ...]:
+        semaphore = Semaphore(self.limit)
+
+        async def run(item: T) -> U:
+            async with semaphore:
+                result = f(item)
+                if isawaitable(result):
+                    result = await result
+                return result
+
+        return await gather(*builtin_map(run, items))
+
+    async def map(self, f: Callable[[T], MaybeAwaitable[U]]) -> "AsyncArray[U]":
+        cls = type(self)
+        return cls(await self.gather(f, self), limit=self.limit)
+
+    async def filter(self, f: Callable[[T], MaybeAwaitable[bool]]) -> "AsyncArray[T]":
+        cls = type(self)
+        keep = await self.gather(f, self)
+        return cls((item for item, kept in zip(self, keep) if kept), limit=self.limit)
+
+    async def flat_map(self, f: Callable[[T], MaybeAwaitable[Iterable[U]]]) -> "AsyncArray[U]":
+        cls = type(self)
+        return cls(chain.from_iterable(await self.gather(f, self)), limit=self.limit)
+
+    async def apply(self: "AsyncArray[Callable[[T], MaybeAwaitable[U]]]", ft: Iterable[T]) -> "AsyncArray[U]":
+        cls = type(self)
+        ft = tuple(ft)
+        pairs = [(f, t) for f in self for t in ft]
+        return cls(await self.gather(lambda pair: pair[0](pair[1]), pairs), limit=self.limit)
+
+    async def reduce(self, i: U, f: Callable[[U, T], MaybeAwaitable[U]]) -> U:
+        for item in self:
+            i = f(i, item)
+            if isawaitable(i):
+                i = await i
+        return i
+
+    def to_array(self) -> Array[T]:
+        return Array(self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({super().__repr__()})"
@@ -0,0 +1,155 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Generic, TypeVar, Hashable, Callable, Any, Optional
+
+from zpy.classes.logical.maybe import Maybe, Nothing, Just
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def typed_key(value: Any) -> Optional[Hashable]:
+    if isinstance(value, (tuple, list)):
+        items = tuple(map(typed_key, value))
+        if None in items:
+            return None
+        return type(value), items
+    if isinstance(value, (set, frozenset)):
+        items = frozenset(map(typed_key, value))
+        if None in items:
+            return None
+        return type(value), items
+    if isinstance(value, dict):
+        items = tuple((key, typed_key(item)) for key, item in value.items())
+        if any(item is None for _key, item in items):
+            return None
+        try:
+            return dict, frozenset(items)
+        except TypeError:
+            return None
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return type(value), value
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class Cache(Generic[K, V], ABC):
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: K) -> Maybe[V]:
+        ...
+
+    @abstractmethod
+    def put(self, key: K, value: V):
+        ...
+
+    @abstractmethod
+    def clear(self):
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.stats})"
+
+    # caches pickle as empty caches with the same configuration; cached results stay in-process
+    def __reduce__(self):
+        return type(self), ()
+
+
+class NoCache(Cache[K, V]):
+    def get(self, key: K) -> Maybe[V]:
+        self.stats.misses += 1
+        return Nothing()
+
+    def put(self, key: K, value: V):
+        pass
+
+    def clear(self):
+        pass
+
+    def __len__(self) -> int:
+        return 0
+
+
+class LRUCache(Cache[K, V]):
+    def __init__(self, maxsize: Optional[int] = 128):
+        super().__init__()
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def get(self, key: K) -> Maybe[V]:
+        if key not in self._entries:
+            self.stats.misses += 1
+            return Nothing()
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+        return Just(self._entries[key])
+
+    def put(self, key: K, value: V):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self):
+        return type(self), (self.maxsize,)
+
+
+class TTLCache(Cache[K, V]):
+    def __init__(self, ttl: float, maxsize: Optional[int] = None, clock: Callable[[], float] = monotonic):
+        super().__init__()
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.clock = clock
+        self._entries = {}
+
+    def get(self, key: K) -> Maybe[V]:
+        if key not in self._entries:
+            self.stats.misses += 1
+            return Nothing()
+        expires, value = self._entries[key]
+        if expires <= self.clock():
+            del self._entries[key]
+            self.stats.evictions += 1
+            self.stats.misses += 1
+            return Nothing()
+        self.stats.hits += 1
+        return Just(value)
+
+    def put(self, key: K, value: V):
+        self._entries.pop(key, None)
+        self._entries[key] = self.clock() + self.ttl, value
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            del self._entries[next(iter(self._entries))]
+            self.stats.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self):
+        return type(self), (self.ttl, self.maxsize, self.clock)
@@ -1,6 +1,6 @@
-from typing import TypeVar
+from typing import TypeVar, Iterator
 
-from zpy.classes.bases.tree import Tree
+from zpy.classes.bases.tree import Tree, TraverseState
 from zpy.classes.collections.array import Array
 from zpy.classes.logical.maybe import Maybe, Nothing, Just
 
@@ -9,6 +9,8 @@ T = TypeVar("T")
 
 
 class CompleteBinaryTree(Array[T], Tree[T]):
+    arity = 2
+
     def root_idx(self) -> int:
         return 0
 
@@ -23,6 +25,9 @@ class CompleteBinaryTree(Array[T], Tree[T]):
             2 * idx + 2
         )
 
+    def has(self, idx: int) -> bool:
+        return 0 <= idx < len(self)
+
     def root(self) -> Maybe[T]:
         return self.get(self.root_idx())
 
@@ -42,3 +47,32 @@ class CompleteBinaryTree(Array[T], Tree[T]):
         if idx == len(self) - 1:
             return Nothing()
         return Just(self[idx + 1])
+
+    def iter_bfs(self) -> Iterator[TraverseState[T]]:
+        depth, next_level = 0, 1
+        for idx, item in enumerate(self):
+            if idx == next_level:
+                depth, next_level = depth + 1, self.arity * next_level + 1
+            yield TraverseState(index=idx, item=item, depth=depth)
+
+    def iter_dfs(self, order: str = "pre") -> Iterator[TraverseState[T]]:
+        if order not in ("pre", "post"):
+            raise ValueError(f"unknown traverse order: {order}")
+        size, arity = len(self), self.arity
+        if not size:
+            return
+        stack, depths = [0], [0]
+        while stack:
+            idx, depth = stack.pop(), depths.pop()
+            if idx < 0:
+                yield TraverseState(index=~idx, item=list.__getitem__(self, ~idx), depth=depth)
+                continue
+            if order == "pre":
+                yield TraverseState(index=idx, item=list.__getitem__(self, idx), depth=depth)
+            else:
+                stack.append(~idx)
+                depths.append(depth)
+            first = arity * idx + 1
+            for child in reversed(range(first, min(first + arity, size))):
+                stack.append(child)
+                depths.append(depth + 1)
@@ -0,0 +1,42 @@
+from typing import TypeVar, Iterable, Callable, Any
+
+from zpy.classes.collections.array import Array
+from zpy.classes.collections.graph.heap import Heap
+from zpy.classes.logical.maybe import Maybe, Nothing, Just
+from zpy.operators import identity
+
+T = TypeVar("T")
+
+
+class DaryHeap(Heap[T]):
+    def __new__(cls, iter_: Iterable[T] = (), key: Callable[[T], Any] = identity, d: int = 4):
+        return super().__new__(cls, iter_, key)
+
+    def __init__(self, iter_: Iterable[T] = (), key: Callable[[T], Any] = identity, d: int = 4):
+        if d < 2:
+            raise ValueError(f"arity must be at least 2: {d}")
+        self.arity = d
+        super().__init__(iter_, key)
+
+    def similar(self, iter_: Iterable[T], key: Callable[[T], Any] = None) -> "DaryHeap[T]":
+        return type(self)(iter_, key=self.key if key is None else key, d=self.arity)
+
+    def parent_idx(self, idx: int) -> int:
+        if idx == 0:
+            raise IndexError("no parent for root")
+        return (idx - 1) // self.arity
+
+    def children_idx(self, idx: int) -> Array[int]:
+        first = self.arity * idx + 1
+        return Array(range(first, first + self.arity))
+
+    def sibling(self, idx: int) -> Maybe[T]:
+        if idx == 0:
+            return Nothing()
+        first = self.arity * self.parent_idx(idx) + 1
+        last = min(first + self.arity, len(self)) - 1
+        if idx < last:
+            return Just(self[idx + 1])
+        if idx > first:
+            return Just(self[idx - 1])
+        return Nothing()
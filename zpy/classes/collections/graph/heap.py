@@ -1,22 +1,195 @@
-from typing import TypeVar, Iterable
-from heapq import heapify
+from typing import TypeVar, Iterable, Callable, Any
 
 from zpy.classes.collections.graph.complete_binary_tree import CompleteBinaryTree
-from zpy.operators import identity
+from zpy.operators import identity, builtin_map
 
 T = TypeVar("T")
+U = TypeVar("U")
 
 
 class Heap(CompleteBinaryTree[T]):
-    def __new__(cls, iter_: Iterable[T] = (), key=identity):
-        self = super().__new__(cls, iter_)
+    def __new__(cls, iter_: Iterable[T] = (), key: Callable[[T], Any] = identity):
+        return super().__new__(cls, iter_)
+
+    def __init__(self, iter_: Iterable[T] = (), key: Callable[[T], Any] = identity):
+        super().__init__(iter_)
         self.key = key
+        self.keys = [key(item) for item in self]
         self.stable_next = len(self)
         self.stable_order = list(range(len(self)))
-        return self
+        self.positions = {order: idx for idx, order in enumerate(self.stable_order)}
+        self.heapify()
+
+    @staticmethod
+    def restore(cls: type, items: list, state: dict) -> "Heap[T]":
+        heap = cls.__new__(cls)
+        list.extend(heap, items)
+        heap.__dict__.update(state)
+        return heap
+
+    def __reduce__(self):
+        return Heap.restore, (type(self), list(self), dict(self.__dict__))
+
+    def similar(self, iter_: Iterable[T], key: Callable[[T], Any] = None) -> "Heap[T]":
+        return type(self)(iter_, key=self.key if key is None else key)
+
+    def map(self, f: Callable[[T], U], key: Callable[[U], Any] = None) -> "Heap[U]":
+        """Keeps this heap's key unless ``key`` is given, so pass one whenever ``f`` changes the item type."""
+        return self.similar(builtin_map(f, self), key)
 
     def cmp_value(self, idx: int):
-        return self.key(self[idx]), self.stable_order[idx]
+        return self.keys[idx], self.stable_order[idx]
+
+    def swap(self, x: int, y: int):
+        item_x, item_y = list.__getitem__(self, x), list.__getitem__(self, y)
+        list.__setitem__(self, x, item_y)
+        list.__setitem__(self, y, item_x)
+        keys, stable_order = self.keys, self.stable_order
+        keys[x], keys[y] = keys[y], keys[x]
+        stable_order[x], stable_order[y] = stable_order[y], stable_order[x]
+        self.positions[stable_order[x]] = x
+        self.positions[stable_order[y]] = y
+
+    def sift_up(self, idx: int):
+        keys, stable_order, positions = self.keys, self.stable_order, self.positions
+        item, key, order = list.__getitem__(self, idx), keys[idx], stable_order[idx]
+        while idx > 0:
+            parent = (idx - 1) // self.arity
+            if not (key, order) < (keys[parent], stable_order[parent]):
+                break
+            list.__setitem__(self, idx, list.__getitem__(self, parent))
+            keys[idx], stable_order[idx] = keys[parent], stable_order[parent]
+            positions[stable_order[idx]] = idx
+            idx = parent
+        list.__setitem__(self, idx, item)
+        keys[idx], stable_order[idx] = key, order
+        positions[order] = idx
+
+    def sift_down(self, idx: int):
+        keys, stable_order, positions = self.keys, self.stable_order, self.positions
+        size = len(self)
+        item, key, order = list.__getitem__(self, idx), keys[idx], stable_order[idx]
+        arity = self.arity
+        while True:
+            first = arity * idx + 1
+            if first >= size:
+                break
+            child = first
+            for sibling in range(first + 1, min(first + arity, size)):
+                if (keys[sibling], stable_order[sibling]) < (keys[child], stable_order[child]):
+                    child = sibling
+            if not (keys[child], stable_order[child]) < (key, order):
+                break
+            list.__setitem__(self, idx, list.__getitem__(self, child))
+            keys[idx], stable_order[idx] = keys[child], stable_order[child]
+            positions[stable_order[idx]] = idx
+            idx = child
+        list.__setitem__(self, idx, item)
+        keys[idx], stable_order[idx] = key, order
+        positions[order] = idx
 
     def heapify(self):
-        heapify(self, key=self.key)
+        for idx in reversed(range((len(self) - 2) // self.arity + 1)):
+            self.sift_down(idx)
+
+    def push(self, item: T) -> int:
+        handle = self.stable_next
+        self.stable_next += 1
+        list.append(self, item)
+        self.keys.append(self.key(item))
+        self.stable_order.append(handle)
+        self.positions[handle] = len(self) - 1
+        self.sift_up(len(self) - 1)
+        return handle
+
+    def peek(self) -> T:
+        if not self:
+            raise IndexError("peek from empty heap")
+        return self[0]
+
+    def pop(self) -> T:
+        if not self:
+            raise IndexError("pop from empty heap")
+        self.swap(0, len(self) - 1)
+        item = list.pop(self)
+        self.keys.pop()
+        del self.positions[self.stable_order.pop()]
+        if self:
+            self.sift_down(0)
+        return item
+
+    def pushpop(self, item: T) -> T:
+        if not self or not self.cmp_value(0) < (self.key(item), self.stable_next):
+            return item
+        return self.replace(item)
+
+    def replace(self, item: T) -> T:
+        if not self:
+            raise IndexError("replace on empty heap")
+        root = self[0]
+        handle = self.stable_next
+        self.stable_next += 1
+        del self.positions[self.stable_order[0]]
+        list.__setitem__(self, 0, item)
+        self.keys[0] = self.key(item)
+        self.stable_order[0] = handle
+        self.positions[handle] = 0
+        self.sift_down(0)
+        return root
+
+    def decrease_key(self, handle: int, item: T):
+        idx = self.positions[handle]
+        key = self.key(item)
+        if self.keys[idx] < key:
+            raise ValueError(f"new key {key!r} is greater than current key {self.keys[idx]!r}")
+        list.__setitem__(self, idx, item)
+        self.keys[idx] = key
+        self.sift_up(idx)
+
+    def remove_at(self, idx: int) -> T:
+        last = len(self) - 1
+        if idx != last:
+            self.swap(idx, last)
+        item = list.pop(self)
+        self.keys.pop()
+        del self.positions[self.stable_order.pop()]
+        if idx < len(self):
+            self.sift_down(idx)
+            self.sift_up(idx)
+        return item
+
+    # list mutators are rerouted through the heap operations so keys, stable_order and positions stay in sync
+    def append(self, item: T):
+        self.push(item)
+
+    def extend(self, iter_: Iterable[T]):
+        for item in iter_:
+            self.push(item)
+
+    def __iadd__(self, iter_: Iterable[T]) -> "Heap[T]":
+        self.extend(iter_)
+        return self
+
+    def remove(self, item: T):
+        self.remove_at(list.index(self, item))
+
+    def __delitem__(self, idx: int):
+        if not isinstance(idx, int):
+            raise TypeError(f"{type(self).__name__} only supports deleting a single index")
+        self.remove_at(range(len(self))[idx])
+
+    def clear(self):
+        list.clear(self)
+        self.keys.clear()
+        self.stable_order.clear()
+        self.positions.clear()
+
+    def unsupported(self, *_args, **_kwargs):
+        raise TypeError(f"{type(self).__name__} does not support positional mutation; "
+                        f"use push, pop, replace or decrease_key")
+
+    insert = unsupported
+    __setitem__ = unsupported
+    __imul__ = unsupported
+    sort = unsupported
+    reverse = unsupported
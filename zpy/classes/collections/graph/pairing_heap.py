@@ -0,0 +1,187 @@
+from typing import TypeVar, Iterable, Callable, Any, Optional, List, Dict
+
+from zpy.classes.bases.tree import Tree
+from zpy.classes.collections.array import Array
+from zpy.classes.logical.maybe import Maybe, Nothing, Just
+from zpy.operators import identity
+
+T = TypeVar("T")
+
+
+class PairingHeap(Tree[T]):
+    def __init__(self, iter_: Iterable[T] = (), key: Callable[[T], Any] = identity):
+        self.key = key
+        self.items = []
+        self.keys = []
+        self.child: List[Optional[int]] = []
+        self.next: List[Optional[int]] = []
+        self.prev: List[Optional[int]] = []
+        self.alive = []
+        self.order = []
+        # slots of popped items are reused, so storage is bounded by the peak size rather than total pushes
+        self.free: List[int] = []
+        # handles are the never-reused push order, so a handle outliving its item can't reach a recycled slot
+        self.slots: Dict[int, int] = {}
+        self.stable_next = 0
+        self.size = 0
+        self._root = None
+        for item in iter_:
+            self.push(item)
+
+    def cmp_value(self, handle: int):
+        return self.keys[handle], self.order[handle]
+
+    def meld(self, x: Optional[int], y: Optional[int]) -> Optional[int]:
+        if x is None:
+            return y
+        if y is None:
+            return x
+        if self.cmp_value(y) < self.cmp_value(x):
+            x, y = y, x
+        first = self.child[x]
+        self.next[y] = first
+        if first is not None:
+            self.prev[first] = y
+        self.prev[y] = x
+        self.child[x] = y
+        return x
+
+    def push(self, item: T) -> int:
+        handle = self.stable_next
+        self.stable_next += 1
+        if self.free:
+            slot = self.free.pop()
+            self.items[slot] = item
+            self.keys[slot] = self.key(item)
+            self.alive[slot] = True
+            self.order[slot] = handle
+        else:
+            slot = len(self.items)
+            self.items.append(item)
+            self.keys.append(self.key(item))
+            self.child.append(None)
+            self.next.append(None)
+            self.prev.append(None)
+            self.alive.append(True)
+            self.order.append(handle)
+        self.slots[handle] = slot
+        self.size += 1
+        self._root = self.meld(self._root, slot)
+        return handle
+
+    def peek(self) -> T:
+        if self._root is None:
+            raise IndexError("peek from empty heap")
+        return self.items[self._root]
+
+    def pop(self) -> T:
+        if self._root is None:
+            raise IndexError("pop from empty heap")
+        root = self._root
+        pairs = []
+        child = self.child[root]
+        while child is not None:
+            second = self.next[child]
+            following = self.next[second] if second is not None else None
+            self.next[child] = self.prev[child] = None
+            if second is not None:
+                self.next[second] = self.prev[second] = None
+            pairs.append(self.meld(child, second))
+            child = following
+        merged = None
+        for pair in reversed(pairs):
+            merged = self.meld(pair, merged)
+        if merged is not None:
+            self.prev[merged] = None
+        self._root = merged
+        self.size -= 1
+        self.alive[root] = False
+        self.child[root] = None
+        item = self.items[root]
+        self.items[root] = None
+        self.keys[root] = None
+        del self.slots[self.order[root]]
+        self.free.append(root)
+        return item
+
+    def pushpop(self, item: T) -> T:
+        self.push(item)
+        return self.pop()
+
+    def replace(self, item: T) -> T:
+        root = self.pop()
+        self.push(item)
+        return root
+
+    def decrease_key(self, handle: int, item: T):
+        if handle not in self.slots:
+            raise KeyError(f"handle {handle} is not in the heap")
+        slot = self.slots[handle]
+        key = self.key(item)
+        if self.keys[slot] < key:
+            raise ValueError(f"new key {key!r} is greater than current key {self.keys[slot]!r}")
+        self.items[slot] = item
+        self.keys[slot] = key
+        if slot == self._root:
+            return
+        prev, following = self.prev[slot], self.next[slot]
+        if self.child[prev] == slot:
+            self.child[prev] = following
+        else:
+            self.next[prev] = following
+        if following is not None:
+            self.prev[following] = prev
+        self.next[slot] = self.prev[slot] = None
+        self._root = self.meld(self._root, slot)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def root(self) -> Maybe[T]:
+        if self._root is None:
+            return Nothing()
+        return Just(self.items[self._root])
+
+    def root_idx(self) -> int:
+        return self._root
+
+    def parent_idx(self, idx: int) -> int:
+        prev = self.prev[idx]
+        while prev is not None and self.child[prev] != idx:
+            idx, prev = prev, self.prev[prev]
+        if prev is None:
+            raise IndexError("no parent for root")
+        return prev
+
+    def parent(self, idx: int) -> Maybe[T]:
+        if idx == self._root:
+            return Nothing()
+        return Just(self.items[self.parent_idx(idx)])
+
+    def children_idx(self, idx: int) -> Array[int]:
+        children = Array()
+        child = self.child[idx]
+        while child is not None:
+            children.append(child)
+            child = self.next[child]
+        return children
+
+    def children(self, idx: int) -> Array[T]:
+        return self.children_idx(idx).map(self.__getitem__)
+
+    def get(self, idx: int) -> Maybe[T]:
+        if 0 <= idx < len(self.items) and self.alive[idx]:
+            return Just(self.items[idx])
+        return Nothing()
+
+    def has(self, idx: int) -> bool:
+        return 0 <= idx < len(self.items) and self.alive[idx]
+
+    def __getitem__(self, idx: int) -> T:
+        return self.items[idx]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.size})"
@@ -0,0 +1,48 @@
+from typing import TypeVar, List, Tuple
+
+from zpy.classes.collections.graph.union_find import UnionFind
+
+T = TypeVar("T")
+
+
+class RollbackUnionFind(UnionFind[T]):
+    def __init__(self, n, compact=False):
+        super().__init__(n, compact)
+        self.history: List[Tuple[int, int, int]] = []
+
+    def root(self, x):
+        uf = self._uf
+        while uf[x] >= 0:
+            x = uf[x]
+        return x
+
+    def link(self, x, y):
+        if self._uf[x] > self._uf[y]:
+            x, y = y, x
+        self.history.append((x, y, self._uf[y]))
+        self._uf[x] += self._uf[y]
+        self._uf[y] = x
+        if self._roots is not None:
+            self._roots.remove(y)
+        if not self._stale:
+            self._children[x].add(y)
+
+    def unite_many(self, edges):
+        for batch in self.batches(edges):
+            for x, y in batch:
+                self.unite(x, y)
+
+    def snapshot(self) -> int:
+        return len(self.history)
+
+    def rollback(self, token: int):
+        if not 0 <= token <= len(self.history):
+            raise ValueError(f"invalid snapshot token: {token}")
+        while len(self.history) > token:
+            x, y, size_y = self.history.pop()
+            self._uf[y] = size_y
+            self._uf[x] -= size_y
+            if self._roots is not None:
+                self._roots.add(y)
+            if not self._stale:
+                self._children[x].discard(y)
@@ -1,5 +1,6 @@
+from array import array
 from collections import defaultdict
-from itertools import repeat
+from itertools import repeat, islice
 from typing import TypeVar, Iterable
 
 from zpy.classes.bases.tree import Forest, Tree
@@ -40,6 +41,9 @@ class UnionFind(Forest[T]):
                 return Just(idx)
             return Nothing()
 
+        def has(self, idx: int) -> bool:
+            return 0 <= idx < self.uf.n
+
         def __getitem__(self, idx: int) -> T:
             return idx
 
@@ -47,17 +51,37 @@ class UnionFind(Forest[T]):
             self._root_idx = root
             self.uf = uf
 
-    def __init__(self, n):
+    def __init__(self, n, compact=False):
         self.n = n
-        self._uf = Array(repeat(-1, times=self.n))
-        self._ranks = Array(repeat(1, times=self.n))
-        self._children = Array([set() for _ in range(self.n)])
-        self.roots = set(range(self.n))
+        self.compact = compact
+        if compact:
+            self._uf = array("i", repeat(-1, self.n))
+            self._ranks = array("b", repeat(1, self.n))
+            self._children = None
+            self._roots = None
+            self._stale = True
+        else:
+            self._uf = Array(repeat(-1, times=self.n))
+            self._ranks = Array(repeat(1, times=self.n))
+            self._children = Array([set() for _ in range(self.n)])
+            self._roots = set(range(self.n))
+            self._stale = False
+
+    @property
+    def roots(self):
+        if self._roots is not None:
+            return self._roots
+        return {idx for idx, parent in enumerate(self._uf) if parent < 0}
 
     def root(self, x):
-        if self._uf[x] < 0:
-            return x
-        return self.root(self._uf[x])
+        uf = self._uf
+        root = x
+        while uf[root] >= 0:
+            root = uf[root]
+        while uf[x] >= 0 and uf[x] != root:
+            uf[x], x = root, uf[x]
+            self._stale = True
+        return root
 
     def parent(self, x):
         if self._uf[x] < 0:
@@ -65,16 +89,20 @@ class UnionFind(Forest[T]):
         return self._uf[x]
 
     def children(self, x):
+        if self._stale:
+            self.rebuild_children()
         return set(self._children[x])
 
+    def rebuild_children(self):
+        self._children = defaultdict(set)
+        for idx, parent in enumerate(self._uf):
+            if parent >= 0:
+                self._children[parent].add(idx)
+        self._stale = False
+
     def flatten(self):
         for idx in range(self.n):
-            root = self.root(idx)
-            if root != idx:
-                parent = self.parent(idx)
-                self._uf[idx] = root
-                self._children[root].add(idx)
-                self._children[parent].remove(idx)
+            self.root(idx)
 
     def rank(self, x):
         return self._ranks[self.root(x)]
@@ -86,23 +114,74 @@ class UnionFind(Forest[T]):
         return self.root(x) == self.root(y)
 
     def unite(self, x, y):
-        x, y = map(self.root, (x, y))
+        x, y = self.root(x), self.root(y)
         if x == y:
             return
-        rank_x, rank_y = map(self.rank, (x, y))
+        self.link(x, y)
+
+    def link(self, x, y):
+        rank_x, rank_y = self._ranks[x], self._ranks[y]
         if rank_x < rank_y:
             x, y = y, x
             rank_x, rank_y = rank_y, rank_x
         self._uf[x] += self._uf[y]
         self._uf[y] = x
-        self.roots.remove(y)
-        self._children[x].add(y)
+        if self._roots is not None:
+            self._roots.remove(y)
+        if not self._stale:
+            self._children[x].add(y)
         if rank_x == rank_y:
             self._ranks[x] += 1
 
+    @staticmethod
+    def batches(pairs, size=1 << 16):
+        if hasattr(pairs, "tolist") and hasattr(pairs, "shape"):
+            for start in range(0, len(pairs), size):
+                yield pairs[start:start + size].tolist()
+        else:
+            iterator = iter(pairs)
+            yield from iter(lambda: list(islice(iterator, size)), [])
+
+    def unite_many(self, edges):
+        uf = self._uf
+
+        def find(x):
+            while uf[x] >= 0:
+                parent = uf[x]
+                grand = uf[parent]
+                if grand < 0:
+                    return parent
+                uf[x] = grand
+                self._stale = True
+                x = grand
+            return x
+
+        for batch in self.batches(edges):
+            for x, y in batch:
+                x, y = find(x), find(y)
+                if x != y:
+                    self.link(x, y)
+
+    def same_many(self, pairs):
+        root = self.root
+        result = Array()
+        for batch in self.batches(pairs):
+            result.extend([root(x) == root(y) for x, y in batch])
+        return result
+
+    def labels(self):
+        root = self.root
+        ids = {}
+        labels = [ids.setdefault(root(idx), len(ids)) for idx in range(self.n)]
+        if self.compact:
+            return array("i", labels)
+        return Array(labels)
+
     def trees(self) -> Iterable[Tree[T]]:
         return Array(map(lambda r: self._UnionFindTree(self, r), self.roots))
 
     def __repr__(self):
         cls = type(self)
+        if self.compact:
+            return f"{cls.__name__}({self.n}, compact=True)"
         return f"{cls.__name__}({self.n})"
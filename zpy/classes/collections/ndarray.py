@@ -0,0 +1,252 @@
+import operator as op
+from itertools import chain
+from typing import Iterable, Iterator, Callable, Tuple, TypeVar
+
+from zpy.classes.bases import Applicative, Cartesian
+from zpy.classes.collections.array import Array
+from zpy.classes.logical.maybe import Maybe, Nothing, Just
+from zpy.function import Function, Composition
+from zpy.operators import builtin_reduce
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+# underlying callables of zpy.operators wrappers and the numpy ufuncs computing the same thing elementwise
+ufunc_names = {
+    op.abs: "absolute",
+    op.neg: "negative",
+    op.pos: "positive",
+    op.inv: "invert",
+    op.not_: "logical_not",
+
+    op.add: "add",
+    op.sub: "subtract",
+    op.mul: "multiply",
+    op.truediv: "true_divide",
+    op.floordiv: "floor_divide",
+    op.mod: "remainder",
+    op.pow: "power",
+    pow: "power",
+
+    op.or_: "bitwise_or",
+    op.and_: "bitwise_and",
+    op.xor: "bitwise_xor",
+    op.rshift: "right_shift",
+    op.lshift: "left_shift",
+
+    op.eq: "equal",
+    op.ne: "not_equal",
+    op.gt: "greater",
+    op.ge: "greater_equal",
+    op.lt: "less",
+    op.le: "less_equal",
+}
+
+# ufuncs whose reduce is the same left fold builtin_reduce would compute
+folding_ufuncs = {
+    "add", "multiply", "bitwise_or", "bitwise_and", "bitwise_xor",
+    "logical_or", "logical_and", "logical_xor", "maximum", "minimum",
+}
+
+
+def ufunc_of(f: Callable) -> Maybe["np.ufunc"]:
+    if np is None:
+        return Nothing()
+    if isinstance(f, np.ufunc):
+        return Just(f)
+    if type(f) is Function and not f.applied_kwargs and f.f in ufunc_names:
+        return Just(getattr(np, ufunc_names[f.f]))
+    return Nothing()
+
+
+def ufunc_call(f: Callable) -> Maybe[Tuple["np.ufunc", tuple]]:
+    ufunc = ufunc_of(f)
+    if not ufunc:
+        return Nothing()
+    applied_args = getattr(f, "applied_args", ())
+    if ufunc.m.nout != 1 or ufunc.m.nin != len(applied_args) + 1:
+        return Nothing()
+    return Just((ufunc.m, applied_args))
+
+
+def vectorize(f: Callable[[T], U]) -> Maybe[Callable[["np.ndarray"], "np.ndarray"]]:
+    stages = reversed(f.functions) if isinstance(f, Composition) else (f,)
+    calls = [ufunc_call(stage) for stage in stages]
+    if not all(calls):
+        return Nothing()
+    calls = [call.m for call in calls]
+
+    def vectorized(values: "np.ndarray") -> "np.ndarray":
+        owned = False
+        for ufunc, applied_args in calls:
+            # intermediates belong to us, so reuse their buffer whenever the stage keeps the dtype
+            if owned and isinstance(values, np.ndarray) and ufunc(*applied_args, values[:0]).dtype == values.dtype:
+                ufunc(*applied_args, values, out=values)
+            else:
+                values = ufunc(*applied_args, values)
+                owned = True
+        return values
+
+    return Just(vectorized)
+
+
+def object_array(items: list) -> "np.ndarray":
+    values = np.empty(len(items), dtype=object)
+    for idx, item in enumerate(items):
+        values[idx] = item
+    return values
+
+
+def values_of(items: list) -> "np.ndarray":
+    # keep a typed array only when numpy can hold every item without reshaping or stringifying it
+    try:
+        values = np.asarray(items)
+    except ValueError:
+        return object_array(items)
+    if values.ndim != 1 or values.dtype == object:
+        return object_array(items)
+    if values.dtype.kind in "US" and not all(isinstance(item, (str, bytes)) for item in items):
+        return object_array(items)
+    return values
+
+
+class NdArray(Applicative[T], Cartesian[T]):
+    def __init__(self, values: Iterable[T] = ()):
+        if np is None:
+            raise ImportError("NdArray requires numpy")
+        if isinstance(values, NdArray):
+            values = values.values
+        elif not isinstance(values, np.ndarray) and not isinstance(values, (list, tuple)):
+            values = list(values)
+        self.values = np.asarray(values)
+
+    @classmethod
+    def pure(cls, m: T) -> "NdArray[T]":
+        return cls.of(m)
+
+    @classmethod
+    def of(cls, *args):
+        if any(callable(arg) for arg in args):
+            return cls(object_array(list(args)))
+        return cls(args)
+
+    def map(self, f: Callable[[T], U]) -> "NdArray[U]":
+        cls = type(self)
+        ufunc = vectorize(f)
+        if ufunc:
+            try:
+                return cls(ufunc.m(self.values))
+            except (TypeError, ValueError):
+                pass
+        return cls(values_of([f(value) for value in self.values.tolist()]))
+
+    def filter(self, f: Callable[[T], bool]) -> "NdArray[T]":
+        cls = type(self)
+        return cls(self.values[self.map(f).values.astype(bool)])
+
+    def flat_map(self, f: Callable[[T], Iterable[U]]) -> "NdArray[U]":
+        cls = type(self)
+        return cls(list(chain.from_iterable(map(f, self.values.tolist()))))
+
+    def product(self, f: Iterable[U]) -> "NdArray[Tuple[T, U]]":
+        cls = type(self)
+        other = f.values.tolist() if isinstance(f, NdArray) else list(f)
+        return cls(object_array([(t, u) for t in self.values.tolist() for u in other]))
+
+    def reduce(self, i: U, f: Callable[[U, T], U]) -> U:
+        ufunc = ufunc_of(f)
+        if ufunc and ufunc.m.__name__ in folding_ufuncs and not getattr(f, "applied_args", ()) \
+                and self.values.size and self.values.dtype.kind in "biufc":
+            try:
+                return ufunc.m.reduce(self.values, initial=i)
+            except (TypeError, ValueError):
+                pass
+        return builtin_reduce(f, self.values.tolist(), i)
+
+    def fold_chunks(self, size: int, i: U, f: Callable[[U, T], U], combine: Callable[[U, U], U]) -> U:
+        return builtin_reduce(combine, (chunk.reduce(i, f) for chunk in self.chunks(size)), i)
+
+    def chunks(self, size: int) -> Iterator["NdArray[T]"]:
+        if size <= 0:
+            raise ValueError(f"chunk size must be positive: {size}")
+        cls = type(self)
+        return (cls(self.values[start:start + size]) for start in range(0, len(self), size))
+
+    def apply(self: "NdArray[Callable[[T], U]]", ft: "NdArray[T]") -> "NdArray[U]":
+        cls = type(self)
+        values = np.asarray(ft)
+        outer = self.outer(values)
+        if outer:
+            return cls(outer.m)
+        results = [NdArray(values).map(f).values for f in self.values.tolist()]
+        if not results:
+            return cls(values[:0])
+        if all(result.dtype == results[0].dtype for result in results):
+            return cls(np.concatenate(results))
+        return cls(values_of([item for result in results for item in result.tolist()]))
+
+    def outer(self: "NdArray[Callable[[T], U]]", values: "np.ndarray") -> Maybe["np.ndarray"]:
+        # add / NdArray.of(1, 2) holds add(1), add(2): apply them at once with the ufunc's outer product
+        functions = self.values.tolist()
+        if not functions or not isinstance(functions[0], Function):
+            return Nothing()
+        first = functions[0]
+        ufunc = ufunc_of(first)
+        if not ufunc or ufunc.m.nin != 2 or len(first.applied_args) != 1:
+            return Nothing()
+        if not all(type(f) is Function and f.f is first.f and len(f.applied_args) == 1 and not f.applied_kwargs
+                   for f in functions):
+            return Nothing()
+        applied = np.asarray([f.applied_args[0] for f in functions])
+        try:
+            return Just(ufunc.m.outer(applied, values).ravel())
+        except (TypeError, ValueError):
+            return Nothing()
+
+    def to_array(self) -> Array[T]:
+        return Array(self.values.tolist())
+
+    def get(self, idx: int) -> Maybe[T]:
+        if not self.has(idx):
+            return Nothing()
+        return Just(self.values[idx])
+
+    def has(self, idx: int) -> bool:
+        return -len(self) <= idx < len(self)
+
+    def get_or(self, idx: int, default: T) -> T:
+        if self.has(idx):
+            return self.values[idx]
+        return default
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.values
+        return self.values.astype(dtype)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.values)
+
+    def __getitem__(self, item):
+        value = self.values[item]
+        if isinstance(value, np.ndarray):
+            return type(self)(value)
+        return value
+
+    def __eq__(self, other):
+        if isinstance(other, NdArray):
+            return self.values.shape == other.values.shape and bool((self.values == other.values).all())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.values!r})"
@@ -0,0 +1,82 @@
+from functools import partial
+from itertools import chain, islice
+from typing import Iterable, Iterator, Callable, Tuple, TypeVar
+
+from zpy.classes.bases import Applicative, Cartesian
+from zpy.classes.collections.array import Array
+from zpy.operators import builtin_map, builtin_filter, builtin_reduce
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+Stage = Callable[[Iterator], Iterator]
+
+
+class Replay(Iterable[T]):
+    def __init__(self, iter_: Iterable[T]):
+        self.source = iter_
+        self.items = None
+
+    def __iter__(self) -> Iterator[T]:
+        if self.items is None:
+            self.items = tuple(self.source)
+        return iter(self.items)
+
+
+class Stream(Applicative[T], Cartesian[T], Iterable[T]):
+    """Lazy pipeline over ``iter_``; a one-shot source such as a generator can only be consumed once."""
+
+    def __init__(self, iter_: Iterable[T] = (), stages: Tuple[Stage, ...] = ()):
+        self.source = iter_
+        self.stages = stages
+
+    @classmethod
+    def pure(cls, m: T) -> "Stream[T]":
+        return cls([m])
+
+    @classmethod
+    def of(cls, *args):
+        return cls(args)
+
+    def __iter__(self) -> Iterator[T]:
+        iterator = iter(self.source)
+        for stage in self.stages:
+            iterator = stage(iterator)
+        return iterator
+
+    def pipe(self, stage: Stage) -> "Stream[U]":
+        cls = type(self)
+        return cls(self.source, self.stages + (stage,))
+
+    def map(self, f: Callable[[T], U]) -> "Stream[U]":
+        return self.pipe(partial(builtin_map, f))
+
+    def filter(self, f: Callable[[T], bool]) -> "Stream[T]":
+        return self.pipe(partial(builtin_filter, f))
+
+    def flat_map(self, f: Callable[[T], Iterable[U]]) -> "Stream[U]":
+        return self.pipe(lambda iterator: chain.from_iterable(builtin_map(f, iterator)))
+
+    def product(self, f: Iterable[U]) -> "Stream[Tuple[T, U]]":
+        inner = Replay(f)
+        return self.pipe(lambda iterator: ((t, u) for t in iterator for u in inner))
+
+    def apply(self: "Stream[Callable[[T], U]]", ft: Iterable[T]) -> "Stream[U]":
+        inner = Replay(ft)
+        return self.pipe(lambda iterator: (f(t) for f in iterator for t in inner))
+
+    def reduce(self, i: U, f: Callable[[U, T], U]) -> U:
+        return builtin_reduce(f, self, i)
+
+    def fold_chunks(self, size: int, i: U, f: Callable[[U, T], U], combine: Callable[[U, U], U]) -> U:
+        if size <= 0:
+            raise ValueError(f"chunk size must be positive: {size}")
+        iterator = iter(self)
+        chunks = iter(lambda: list(islice(iterator, size)), [])
+        return builtin_reduce(combine, (builtin_reduce(f, chunk, i) for chunk in chunks), i)
+
+    def to_array(self) -> Array[T]:
+        return Array(self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({repr(self.source)})"
@@ -9,6 +9,8 @@ V = TypeVar("V")
 
 
 class Maybe(Applicative[T], Iterable[T], ABC):
+    __slots__ = ()
+
     @abstractmethod
     def map(self, f: Callable[[T], U]) -> "Maybe[U]":
         ...
@@ -17,6 +19,10 @@ class Maybe(Applicative[T], Iterable[T], ABC):
     def apply(self, ff: "Maybe[Callable[[T], U]]") -> "Callable[[Maybe[T]], Maybe[U]]":
         ...
 
+    @abstractmethod
+    def filter(self, f: Callable[[T], bool]) -> "Maybe[T]":
+        ...
+
     @abstractmethod
     def unwrap(self) -> T:
         ...
@@ -35,8 +41,27 @@ class Maybe(Applicative[T], Iterable[T], ABC):
 
 
 class Just(Maybe[T]):
+    __slots__ = ("m",)
+
     def __init__(self, m: T):
-        self.m = m
+        object.__setattr__(self, "m", m)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, Just):
+            return NotImplemented
+        return self.m == other.m
+
+    def __hash__(self):
+        return hash((Just, self.m))
+
+    def __reduce__(self):
+        return type(self), (self.m,)
 
     @classmethod
     def pure(cls, m: T) -> "Just[T]":
@@ -57,6 +82,11 @@ class Just(Maybe[T]):
         cls = type(self)
         return fa.map(self.m)
 
+    def filter(self, f: Callable[[T], bool]) -> "Maybe[T]":
+        if f(self.m):
+            return self
+        return Nothing()
+
     def unwrap(self) -> T:
         return self
 
@@ -73,13 +103,17 @@ class ForceUnwrapError(TypeError):
 
 
 class Nothing(Maybe[Any]):
+    __slots__ = ()
     __instance = None
 
     def __new__(cls, *args, **kwargs):
-        if not cls.__instance:
+        if cls.__instance is None:
             cls.__instance = super().__new__(cls)
         return cls.__instance
 
+    def __reduce__(self):
+        return type(self), ()
+
     @classmethod
     def pure(cls, _m: T) -> "Nothing":
         return cls()
@@ -93,6 +127,9 @@ class Nothing(Maybe[Any]):
     def apply(self, ff: Apply[Callable[[T], U]]) -> "Nothing":
         return self
 
+    def filter(self, _f: Callable[[Any], bool]) -> "Nothing":
+        return self
+
     def unwrap(self) -> T:
         raise ForceUnwrapError("tried to unwrap nothing")
 
@@ -1,37 +1,136 @@
-import re
+import sys
 import warnings
 from collections import deque
-from inspect import signature
-from functools import partial
-from typing import TypeVar, Callable, Any, Generic
+from enum import Enum
+from inspect import signature, Signature, Parameter, iscoroutinefunction, isawaitable
+from functools import partial, cached_property
+from typing import TypeVar, Callable, Any, Generic, Iterable, Hashable, Tuple
 
 from zpy.classes.bases import Functor
+from zpy.classes.collections.cache import Cache, CacheStats, NoCache, LRUCache, TTLCache, typed_key
+from zpy.classes.logical.maybe import Maybe, Nothing, Just
 
 T = TypeVar("T")
 U = TypeVar("U")
 V = TypeVar("V")
 
 
+class CallPlan:
+    def __init__(self, signature_: Signature):
+        self.signature = signature_
+        parameters = tuple(signature_.parameters.values())
+        self.positional = tuple(
+            param for param in parameters
+            if param.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+        )
+        self.keyword_only = tuple(param for param in parameters if param.kind == Parameter.KEYWORD_ONLY)
+        self.arity = len(self.positional)
+        self.positional_only = sum(1 for param in self.positional if param.kind == Parameter.POSITIONAL_ONLY)
+        self.keywords = frozenset(param.name for param in self.positional[self.positional_only:] + self.keyword_only)
+        self.var_args = any(param.kind == Parameter.VAR_POSITIONAL for param in parameters)
+        self.var_kwargs = any(param.kind == Parameter.VAR_KEYWORD for param in parameters)
+        self.direct = all(param.default is not Parameter.empty for param in self.keyword_only)
+
+    def bind(self, args: tuple, kwargs: dict):
+        arity = self.arity
+        kw_arguments = dict(kwargs)
+        apply_args = list(args[:arity])
+        apply_kwargs = {}
+        missing_params = []
+        for param in self.positional[len(apply_args):]:
+            if param.kind == Parameter.POSITIONAL_OR_KEYWORD and param.name in kw_arguments:
+                apply_kwargs[param.name] = kw_arguments.pop(param.name)
+            elif param.default is Parameter.empty:
+                missing_params.append(param)
+        for param in self.keyword_only:
+            if param.name in kw_arguments:
+                apply_kwargs[param.name] = kw_arguments.pop(param.name)
+            elif param.default is Parameter.empty:
+                missing_params.append(param)
+
+        exceeding_args = list(args[arity:])
+        if self.var_args:
+            apply_args.extend(exceeding_args)
+            exceeding_args = []
+        if self.var_kwargs:
+            apply_kwargs.update(kw_arguments)
+            kw_arguments = {}
+        return apply_args, apply_kwargs, missing_params, exceeding_args, kw_arguments
+
+    def normalize(self, apply_args: list, apply_kwargs: dict) -> Tuple[tuple, dict]:
+        args = list(apply_args[:self.arity])
+        for param in self.positional[len(args):]:
+            if param.name in apply_kwargs and param.kind == Parameter.POSITIONAL_OR_KEYWORD:
+                args.append(apply_kwargs[param.name])
+            elif param.default is not Parameter.empty:
+                args.append(param.default)
+        args.extend(apply_args[self.arity:])
+        kwargs = {
+            param.name: apply_kwargs.get(param.name, param.default)
+            for param in self.keyword_only
+        }
+        for name in sorted(apply_kwargs.keys() - self.keywords):
+            kwargs[name] = apply_kwargs[name]
+        return tuple(args), kwargs
+
+    def remaining(self, args: tuple, kwargs: dict) -> Signature:
+        parameters = []
+        keyword_applied = False
+        for idx, param in enumerate(self.signature.parameters.values()):
+            if param.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD) and idx < len(args):
+                continue
+            if param.kind not in (Parameter.POSITIONAL_ONLY, Parameter.VAR_POSITIONAL) and param.name in kwargs:
+                keyword_applied = keyword_applied or param.kind == Parameter.POSITIONAL_OR_KEYWORD
+                continue
+            if keyword_applied and param.kind == Parameter.POSITIONAL_OR_KEYWORD:
+                param = param.replace(kind=Parameter.KEYWORD_ONLY)
+            elif keyword_applied and param.kind == Parameter.VAR_POSITIONAL:
+                continue
+            parameters.append(param)
+        return self.signature.replace(parameters=parameters)
+
+
 class Function(Functor[T]):
-    def __new__(cls, f: Callable[[T], Any] = None, name=None, signature_=None, applied_args=None, applied_kwargs=None):
+    def __new__(cls, f: Callable[[T], Any] = None, name=None, signature_=None, applied_args=None, applied_kwargs=None,
+                call_plan=None):
         if isinstance(f, Function):
             return f
         if not f:
             return partial(cls, name=name, signature_=signature_)
         return super().__new__(cls)
 
-    def __init__(self, f: Callable[[T], Any] = None, name=None, signature_=None, applied_args=None, applied_kwargs=None):
+    def __init__(self, f: Callable[[T], Any] = None, name=None, signature_=None, applied_args=None, applied_kwargs=None,
+                 call_plan=None):
         if isinstance(f, Function):
             return
         self.__doc__ = f.__doc__
         self.__name__ = name or f.__name__
-        self.signature = signature_ or signature(f)
-        self.applied_args = applied_args or []
-        self.applied_kwargs = applied_kwargs or {}
+        self.__module__ = getattr(f, "__module__", None)
+        self.__qualname__ = getattr(f, "__qualname__", self.__name__)
+        if call_plan is not None:
+            self.call_plan = call_plan
+        self.__deferred_signature = signature_
+        self.applied_args = tuple(applied_args or ())
+        self.applied_kwargs = dict(applied_kwargs or {})
+        self.__signature = None
         self.__applied_args = ""
         self.f = f
         self.__wrapped__ = f
-        self.__signature__ = self.signature
+
+    @cached_property
+    def call_plan(self) -> CallPlan:
+        return CallPlan(self.__deferred_signature or signature(self.f))
+
+    @property
+    def signature(self) -> Signature:
+        if self.__signature is None:
+            if self.applied_args or self.applied_kwargs:
+                self.__signature = self.call_plan.remaining(self.applied_args, self.applied_kwargs)
+            else:
+                self.__signature = self.call_plan.signature
+        return self.__signature
+
+    __signature__ = signature
 
     @property
     def __applied_args__(self):
@@ -54,56 +153,17 @@ class Function(Functor[T]):
         return f"{name}{self.__applied_args__}{self.signature}"
 
     def __call__(self, *args, **kwargs) -> U:
-        cls = type(self)
-        arguments = deque(args)
-        kw_arguments = dict(**kwargs)
-        parameters = deque(self.signature.parameters.values())
-
-        apply_args = []
-        apply_kwargs = {}
-        missing_params = []
-        exceeding_args = []
-        exceeding_kwargs = {}
-        while True:
-            if not arguments and not kw_arguments and not parameters:
-                break
-            if (arguments or kw_arguments) and not parameters:
-                exceeding_args.extend(arguments)
-                exceeding_kwargs.update(kw_arguments)
-                break
-            param = parameters.popleft()
-            if param.kind == param.POSITIONAL_ONLY:
-                if not arguments:
-                    if param.default is param.empty:
-                        missing_params.append(param)
-                    else:
-                        apply_args.append(param.default)
-                else:
-                    apply_args.append(arguments.popleft())
-            elif param.kind == param.KEYWORD_ONLY:
-                if param.name not in kw_arguments:
-                    if param.default is param.empty:
-                        missing_params.append(param)
-                    else:
-                        apply_kwargs[param.name] = param.default
-                else:
-                    apply_kwargs[param.name] = kw_arguments.pop(param)
-            elif param.kind == param.VAR_POSITIONAL:
-                apply_args.extend(arguments)
-                arguments.clear()
-            elif param.kind == param.VAR_KEYWORD:
-                apply_kwargs.update(kw_arguments)
-                kw_arguments.clear()
-            else:
-                if arguments:
-                    apply_args.append(arguments.popleft())
-                elif param.name in kw_arguments:
-                    apply_kwargs[param.name] = kw_arguments.pop(param.name)
-                elif kw_arguments:
-                    missing_params.append(param)
-                else:
-                    break
-
+        plan = self.call_plan
+        if self.applied_args:
+            args = self.applied_args + args
+        if self.applied_kwargs:
+            kwargs = {**self.applied_kwargs, **kwargs}
+        if not kwargs and plan.direct:
+            if len(args) == plan.arity or plan.var_args and len(args) > plan.arity:
+                return self.f(*args)
+        return self.complete(*plan.bind(args, kwargs))
+
+    def complete(self, apply_args, apply_kwargs, missing_params, exceeding_args, exceeding_kwargs) -> U:
         if missing_params and exceeding_args:
             warnings.warn(RuntimeWarning(f"exceeding arguments {repr(exceeding_args)} are ignored"
                                          f" because keyword parameters {repr(missing_params)} are missing"))
@@ -112,14 +172,58 @@ class Function(Functor[T]):
                                          f" because parameters {repr(missing_params)} are missing"))
 
         if missing_params:
-            return self.partial(*apply_args, **apply_kwargs)
+            return self.curry(apply_args, apply_kwargs)
         if exceeding_args or exceeding_kwargs:
             return self.f(*apply_args, **apply_kwargs)(*exceeding_args, **exceeding_kwargs)
         return self.f(*apply_args, **apply_kwargs)
 
+    def curry(self, applied_args, applied_kwargs) -> "Function":
+        cls = type(self)
+        return cls(
+            self.f,
+            name=self.__name__,
+            applied_args=applied_args,
+            applied_kwargs=applied_kwargs,
+            call_plan=self.call_plan,
+        )
+
     def partial(self, *args, **kwargs):
+        return self.curry(self.applied_args + args, {**self.applied_kwargs, **kwargs})
+
+    def memoize(self, maxsize: int = 128, ttl: float = None, key: Callable[..., Hashable] = None) -> "Memoized":
+        if ttl is None:
+            cache = LRUCache(maxsize)
+        else:
+            cache = TTLCache(ttl, maxsize)
+        return Memoized(
+            self.f,
+            name=self.__name__,
+            applied_args=self.applied_args,
+            applied_kwargs=self.applied_kwargs,
+            call_plan=self.call_plan,
+            cache=cache,
+            key=key,
+        )
+
+    def registered(self) -> "Function":
+        module = sys.modules.get(self.__module__)
+        registered = getattr(module, self.__qualname__, None)
+        if isinstance(registered, Function) and registered.f is self.f:
+            return registered
+
+    @staticmethod
+    def restore(f: "Function", applied_args: tuple, applied_kwargs: dict) -> "Function":
+        return f.partial(*applied_args, **applied_kwargs)
+
+    def __reduce__(self):
         cls = type(self)
-        return cls(partial(self, *args, **kwargs), name=self.__name__, applied_args=args, applied_kwargs=kwargs)
+        registered = self.registered()
+        if self.applied_args or self.applied_kwargs:
+            base = registered or cls(self.f, name=self.__name__, call_plan=self.call_plan)
+            return Function.restore, (base, self.applied_args, self.applied_kwargs)
+        if registered is self:
+            return self.__qualname__
+        return cls, (self.f, self.__name__, self.call_plan.signature)
 
     @classmethod
     def pure(cls, m: U) -> "Callable[[T], U]":
@@ -127,9 +231,8 @@ class Function(Functor[T]):
 
     def map(self: Callable[[T], U], f: Callable[[U], V]) -> Callable[[T], V]:
         f = Function(f)
-        cls = type(self)
-        return cls(
-            lambda t: f(self(t)),
+        return Composition(
+            f, self,
             name=f"{f.__name__}{f.__applied_args__} / {self.__name__}{self.__applied_args__}"
         )
         
@@ -142,16 +245,138 @@ class Function(Functor[T]):
 
     def __mul__(self: Callable[[T], U], f: Callable[[V], T]) -> Callable[[V], U]:
         f = Function(f)
+        return Composition(
+            self, f,
+            name=f"{self.__name__}{self.__applied_args__} * {f.__name__}{f.__applied_args__}"
+        )
+
+
+class Memoized(Function[T]):
+    def __new__(cls, f: Callable[[T], Any] = None, name=None, signature_=None, applied_args=None, applied_kwargs=None,
+                call_plan=None, cache: Cache = None, key: Callable[..., Hashable] = None):
+        return super().__new__(cls, f, name, signature_, applied_args, applied_kwargs, call_plan)
+
+    def __init__(self, f: Callable[[T], Any] = None, name=None, signature_=None, applied_args=None,
+                 applied_kwargs=None, call_plan=None, cache: Cache = None, key: Callable[..., Hashable] = None):
+        super().__init__(f, name, signature_, applied_args, applied_kwargs, call_plan)
+        self.cache = LRUCache() if cache is None else cache
+        self.key = key
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    @staticmethod
+    def typed_args(args: tuple, kwargs: dict) -> Hashable:
+        return (
+            tuple((type(arg), arg) for arg in args),
+            tuple((name, type(arg), arg) for name, arg in kwargs.items()),
+        )
+
+    def __reduce__(self):
+        registered = self.registered()
+        if isinstance(registered, Memoized) and registered.cache is self.cache:
+            return super().__reduce__()
+        return partial(type(self), cache=self.cache, key=self.key), (
+            self.f, self.__name__, None, self.applied_args, self.applied_kwargs, self.call_plan
+        )
+
+    def curry(self, applied_args, applied_kwargs) -> "Memoized":
         cls = type(self)
         return cls(
-            lambda t: self(f(t)),
-            name=f"{self.__name__}{self.__applied_args__} * {f.__name__}{f.__applied_args__}"
+            self.f,
+            name=self.__name__,
+            applied_args=applied_args,
+            applied_kwargs=applied_kwargs,
+            call_plan=self.call_plan,
+            cache=self.cache,
+            key=self.key,
+        )
+
+    def __call__(self, *args, **kwargs) -> U:
+        plan = self.call_plan
+        bound = plan.bind(self.applied_args + args, {**self.applied_kwargs, **kwargs})
+        apply_args, apply_kwargs, missing_params, exceeding_args, exceeding_kwargs = bound
+        if missing_params or exceeding_args or exceeding_kwargs:
+            return self.complete(*bound)
+        args, kwargs = plan.normalize(apply_args, apply_kwargs)
+        # unhashable arguments can't be told apart by the cache, so such calls go through uncached
+        try:
+            key = self.key(*args, **kwargs) if self.key else self.typed_args(args, kwargs)
+            hash(key)
+        except TypeError:
+            key = None
+        if key is None:
+            self.cache.stats.misses += 1
+            return self.f(*args, **kwargs)
+        for result in self.cache.get(key):
+            return result
+        result = self.f(*args, **kwargs)
+        self.cache.put(key, result)
+        return result
+
+
+def memoize(f: Callable = None, maxsize: int = 128, ttl: float = None, key: Callable[..., Hashable] = None):
+    if f is None:
+        return partial(memoize, maxsize=maxsize, ttl=ttl, key=key)
+    return Function(f).memoize(maxsize=maxsize, ttl=ttl, key=key)
+
+
+class Composition(Function[T]):
+    call_signature = Signature([
+        Parameter(name="t", kind=Parameter.POSITIONAL_ONLY)
+    ])
+
+    def __new__(cls, *functions: Callable, name=None):
+        return object.__new__(cls)
+
+    def __init__(self, *functions: Callable, name=None):
+        flattened = []
+        for f in functions:
+            if isinstance(f, Composition):
+                flattened.extend(f.functions)
+            else:
+                flattened.append(f)
+        self.functions = tuple(flattened)
+        self.stages = tuple(self.unwrap(f) for f in reversed(self.functions))
+        self.is_async = any(iscoroutinefunction(getattr(f, "f", f)) for f in self.functions)
+        name = name or " * ".join(
+            f"{f.__name__}{getattr(f, '__applied_args__', '')}"
+            for f in functions
         )
+        super().__init__(self.__call__, name=name, signature_=self.call_signature)
+
+    @staticmethod
+    def unwrap(f: Callable) -> Callable:
+        if type(f) is not Function:
+            return f
+        plan = f.call_plan
+        if not plan.direct or plan.var_args or f.applied_kwargs or plan.arity != len(f.applied_args) + 1:
+            return f
+        if f.applied_args:
+            return partial(f.f, *f.applied_args)
+        return f.f
+
+    def __reduce__(self):
+        return partial(Composition, name=self.__name__), self.functions
+
+    def __call__(self, t):
+        if self.is_async:
+            return self.run_async(t)
+        for f in self.stages:
+            t = f(t)
+        return t
+
+    async def run_async(self, t):
+        for f in self.stages:
+            t = f(t)
+            if isawaitable(t):
+                t = await t
+        return t
 
 
 class UnderBar:
     _instance = None
-    pattern = re.compile(r"(?<![a-zA-Z0-9])_(?![a-zA-Z0-9])")
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
@@ -166,38 +391,160 @@ _ = UnderBar()
 
 
 class When(Generic[T, U]):
+    sequences = (tuple, list)
+
     def __init__(self, m: Any, expr_func: Callable[[Any], U]):
-        self.m = re.compile(re.sub(UnderBar.pattern, r"(?<![a-zA-Z0-9])(.+)(?![a-zA-Z0-9])", repr(m)))
+        self.m = m
         self.f = Function(expr_func)
 
-    def matches(self, pattern: str):
-        return self.m.match(pattern)
+    @classmethod
+    def literal_key(cls, m: Any):
+        if m is _ or isinstance(m, (*cls.sequences, dict)):
+            return None
+        try:
+            hash(m)
+        except TypeError:
+            return None
+        return type(m), m
+
+    @classmethod
+    def match(cls, m: Any, case: Any) -> bool:
+        if m is _:
+            return True
+        if type(m) is not type(case):
+            return False
+        if isinstance(m, cls.sequences):
+            return len(m) == len(case) and all(map(cls.match, m, case))
+        if isinstance(m, dict):
+            return m.keys() == case.keys() and all(cls.match(value, case[key]) for key, value in m.items())
+        return m == case
+
+    def matches(self, case: T) -> bool:
+        return self.match(self.m, case)
 
     def __contains__(self, item: T):
-        return self.matches(repr(item))
+        return self.matches(item)
+
+
+class DecisionTree(Generic[T, U]):
+    class _Node:
+        def __init__(self):
+            self.children = {}
+            self.wild = None
+            self.leaves = []
+
+    def __init__(self, patterns: Iterable[When[T, U]] = ()):
+        self.literals = {}
+        self.sequences = {}
+        self.wildcards = []
+        for index, pattern in enumerate(patterns):
+            self.add(index, pattern)
+
+    def add(self, index: int, pattern: When[T, U]):
+        m = pattern.m
+        key = When.literal_key(m)
+        if key is not None:
+            self.literals.setdefault(key, (index, pattern))
+        elif isinstance(m, When.sequences):
+            node = self.sequences.setdefault((type(m), len(m)), self._Node())
+            for item in m:
+                item_key = When.literal_key(item)
+                if item_key is not None:
+                    node = node.children.setdefault(item_key, self._Node())
+                else:
+                    node.wild = node.wild or self._Node()
+                    node = node.wild
+            node.leaves.append((index, pattern))
+        else:
+            self.wildcards.append((index, pattern))
+
+    def find(self, case: T) -> "Maybe[When[T, U]]":
+        best = None
+        key = When.literal_key(case)
+        if key is not None:
+            best = self.literals.get(key)
+        elif isinstance(case, When.sequences):
+            root = self.sequences.get((type(case), len(case)))
+            stack = [(root, 0)] if root else []
+            while stack:
+                node, depth = stack.pop()
+                if depth == len(case):
+                    for index, pattern in node.leaves:
+                        if best is not None and best[0] < index:
+                            break
+                        if pattern.matches(case):
+                            best = index, pattern
+                            break
+                    continue
+                if node.wild:
+                    stack.append((node.wild, depth + 1))
+                item_key = When.literal_key(case[depth])
+                if item_key in node.children:
+                    stack.append((node.children[item_key], depth + 1))
+        for index, pattern in self.wildcards:
+            if best is not None and best[0] < index:
+                break
+            if pattern.matches(case):
+                best = index, pattern
+                break
+        if best is None:
+            return Nothing()
+        return Just(best[1])
+
+
+class CachePolicy(Enum):
+    NONE = "none"
+    PATTERN = "pattern"
+    LRU = "lru"
+    TTL = "ttl"
 
 
 class Case(Generic[T, U]):
-    def __init__(self, *patterns: When[T, U]):
+    def __init__(self, *patterns: When[T, U], policy: CachePolicy = CachePolicy.NONE, maxsize: int = 128,
+                 ttl: float = None):
         self.patterns = deque(patterns)
-        self._cache = {}
+        self.policy = policy
+        self._tree = None
+        if policy is CachePolicy.NONE:
+            self.cache = NoCache()
+        elif policy is CachePolicy.TTL:
+            if ttl is None:
+                raise ValueError("ttl is required for CachePolicy.TTL")
+            self.cache = TTLCache(ttl, maxsize)
+        else:
+            self.cache = LRUCache(maxsize)
+
+    @property
+    def tree(self) -> DecisionTree[T, U]:
+        if self._tree is None:
+            self._tree = DecisionTree(self.patterns)
+        return self._tree
+
+    def invalidate(self):
+        self._tree = None
+        self.cache.clear()
 
     def append(self, pattern: When[T, U]):
         self.patterns.append(pattern)
+        self.invalidate()
 
     def prepend(self, pattern: When[T, U]):
         self.patterns.appendleft(pattern)
+        self.invalidate()
 
     def __call__(self, case: T) -> U:
-        case_repr = repr(case)
-        if case_repr not in self._cache:
-            for pattern in self.patterns:
-                if pattern.matches(case_repr):
-                    self._cache[case_repr] = pattern.f(case)
-                    break
-            else:
-                raise NotImplementedError(f"Unknown Case: {case}")
-        return self._cache[case_repr]
+        key = None if self.policy is CachePolicy.NONE else typed_key(case)
+        if key is not None:
+            for cached in self.cache.get(key):
+                if self.policy is CachePolicy.PATTERN:
+                    return cached.f(case)
+                return cached
+        for pattern in self.tree.find(case):
+            result = pattern.f(case)
+            if key is not None:
+                self.cache.put(key, pattern if self.policy is CachePolicy.PATTERN else result)
+            return result
+        raise NotImplementedError(f"Unknown Case: {case}")
 
     def __or__(self, other):
         if isinstance(other, When):
@@ -1,11 +1,12 @@
 from inspect import Signature, Parameter
 from itertools import product
 from functools import reduce
-from typing import Callable, TypeVar, Any, Tuple
+from typing import Callable, TypeVar, Any, Tuple, Optional
 
 from zpy.classes.bases import Functor, Apply, Cartesian
 from zpy.classes.bases.utility.pretty import Pretty
-from zpy.function import Function
+from zpy.function import Function, Composition
+from zpy.sink import Sink, Tracer
 import operator as op
 
 T = TypeVar("T")
@@ -21,28 +22,33 @@ builtin_product = product
 
 
 @Function
-def map(f: Callable[[T], U]) -> Callable[[Functor[T]], Functor[U]]:
-    return Function(lambda a: a.map(f))
+def map(f: Callable[[T], U], a: Functor[T]) -> Functor[U]:
+    return a.map(f)
 
 
 @Function
-def filter(f: Callable[[T], bool]) -> Callable[[Functor[T]], Functor[T]]:
-    return Function(lambda a: a.filter(f))
+def filter(f: Callable[[T], bool], a: Functor[T]) -> Functor[T]:
+    return a.filter(f)
 
 
 @Function
-def reduce(i: U, f: Callable[[U, T], U]) -> Callable[[Functor[T]], U]:
-    return Function(lambda a: a.reduce(i, f))
+def reduce(i: U, f: Callable[[U, T], U], a: Functor[T]) -> U:
+    return a.reduce(i, f)
 
 
 @Function
-def apply(f: Apply[Callable[[T], U]]) -> Callable[[Apply[T]], Apply[U]]:
-    return Function(lambda a: f.apply(a))
+def fold_chunks(size: int, i: U, f: Callable[[U, T], U], combine: Callable[[U, U], U], a: Functor[T]) -> U:
+    return a.fold_chunks(size, i, f, combine)
 
 
 @Function
-def product(f: Cartesian[U]) -> Callable[[Cartesian[T]], Cartesian[Tuple[T, U]]]:
-    return Function(lambda a: a.product(f))
+def apply(f: Apply[Callable[[T], U]], a: Apply[T]) -> Apply[U]:
+    return f.apply(a)
+
+
+@Function
+def product(f: Cartesian[U], a: Cartesian[T]) -> Cartesian[Tuple[T, U]]:
+    return a.product(f)
 
 
 @Function
@@ -63,7 +69,7 @@ lift_a = apply
 def compose(*f):
     if not f:
         return identity
-    return f[0](compose(*f[1:]))
+    return Composition(*f)
 
 
 @Function
@@ -77,8 +83,8 @@ def identity(a: T) -> T:
 
 
 @Function
-def const(a: T) -> Callable[["Any"], T]:
-    return Function(lambda _: a)
+def const(a: T, _b: Any) -> T:
+    return a
 
 
 @Function
@@ -87,113 +93,145 @@ def fork(join, f, g, x):
 
 
 @Function
-def tap(opr):
-    return Function(lambda x: fork(const)(identity)(opr)(x))
+def tap(opr, x):
+    opr(x)
+    return x
+
+
+default_tracer = Tracer()
 
 
 @Function
 def trace(x):
-    print(x)
+    default_tracer(x)
 
 
-unary = Signature([
-    Parameter(name="a", kind=Parameter.POSITIONAL_ONLY)
-])
-# unary operator
-# math
-abs = Function(op.abs, signature_=unary)
-neg = Function(op.neg, signature_=unary)
-pos = Function(op.pos, signature_=unary)
-index = Function(op.index, signature_=unary)
+def tracer(sink: Optional[Sink] = None, every_n: int = 1, rate: float = 1.0) -> Function:
+    return Function(Tracer(sink, every_n, rate), name="trace", signature_=unary)
 
-# bit
-inv = Function(op.inv, signature_=unary)
-invert = inv
 
-# boolean
-not_ = Function(op.not_, signature_=unary)
-truth = Function(op.truth, signature_=unary)
+def configure_trace(sink: Optional[Sink] = None, every_n: int = 1, rate: float = 1.0):
+    default_tracer.configure(sink, every_n, rate)
 
+
+unary = Signature([
+    Parameter(name="a", kind=Parameter.POSITIONAL_ONLY)
+])
 binary = Signature([
     Parameter(name="a", kind=Parameter.POSITIONAL_ONLY),
     Parameter(name="b", kind=Parameter.POSITIONAL_ONLY),
 ])
-# binary operator
-# math
-add = Function(op.add, signature_=binary)
-sub = Function(op.sub, signature_=binary)
-mul = Function(op.mul, signature_=binary)
-truediv = Function(op.truediv, signature_=binary)
-floordiv = Function(op.floordiv, signature_=binary)
-mod = Function(op.mod, signature_=binary)
-matmul = Function(op.matmul, signature_=binary)
-divmod = Function(divmod, signature_=binary)
-pow = Function(builtin_pow)
-
-iadd = Function(op.iadd, signature_=binary)
-isub = Function(op.isub, signature_=binary)
-imul = Function(op.imul, signature_=binary)
-itruediv = Function(op.itruediv, signature_=binary)
-ifloordiv = Function(op.ifloordiv, signature_=binary)
-imod = Function(op.imod, signature_=binary)
-imatmul = Function(op.imatmul, signature_=binary)
-ipow = Function(op.ipow, signature_=binary)
-
-# bit
-or_ = Function(op.or_, signature_=binary)
-and_ = Function(op.and_, signature_=binary)
-xor = Function(op.xor, signature_=binary)
-rshift = Function(op.rshift, signature_=binary)
-lshift = Function(op.lshift, signature_=binary)
-
-ior = Function(op.ior, signature_=binary)
-iand = Function(op.iand, signature_=binary)
-ixor = Function(op.ixor, signature_=binary)
-irshift = Function(op.irshift, signature_=binary)
-ilshift = Function(op.ilshift, signature_=binary)
-
-# boolean
-eq = Function(op.eq, signature_=binary)
-ne = Function(op.ne, signature_=binary)
-gt = Function(op.gt, signature_=binary)
-ge = Function(op.ge, signature_=binary)
-lt = Function(op.lt, signature_=binary)
-le = Function(op.le, signature_=binary)
-is_ = Function(op.is_, signature_=binary)
-is_not = Function(op.is_not, signature_=binary)
-
-# object operator
-itemgetter = Function(
-    op.itemgetter,
-    signature_=Signature([
+
+# operator wrappers are built on first access through module __getattr__
+_operators = {
+    # unary operator
+    # math
+    "abs": (op.abs, unary),
+    "neg": (op.neg, unary),
+    "pos": (op.pos, unary),
+    "index": (op.index, unary),
+
+    # bit
+    "inv": (op.inv, unary),
+
+    # boolean
+    "not_": (op.not_, unary),
+    "truth": (op.truth, unary),
+
+    # binary operator
+    # math
+    "add": (op.add, binary),
+    "sub": (op.sub, binary),
+    "mul": (op.mul, binary),
+    "truediv": (op.truediv, binary),
+    "floordiv": (op.floordiv, binary),
+    "mod": (op.mod, binary),
+    "matmul": (op.matmul, binary),
+    "divmod": (divmod, binary),
+    "pow": (builtin_pow, None),
+
+    "iadd": (op.iadd, binary),
+    "isub": (op.isub, binary),
+    "imul": (op.imul, binary),
+    "itruediv": (op.itruediv, binary),
+    "ifloordiv": (op.ifloordiv, binary),
+    "imod": (op.imod, binary),
+    "imatmul": (op.imatmul, binary),
+    "ipow": (op.ipow, binary),
+
+    # bit
+    "or_": (op.or_, binary),
+    "and_": (op.and_, binary),
+    "xor": (op.xor, binary),
+    "rshift": (op.rshift, binary),
+    "lshift": (op.lshift, binary),
+
+    "ior": (op.ior, binary),
+    "iand": (op.iand, binary),
+    "ixor": (op.ixor, binary),
+    "irshift": (op.irshift, binary),
+    "ilshift": (op.ilshift, binary),
+
+    # boolean
+    "eq": (op.eq, binary),
+    "ne": (op.ne, binary),
+    "gt": (op.gt, binary),
+    "ge": (op.ge, binary),
+    "lt": (op.lt, binary),
+    "le": (op.le, binary),
+    "is_": (op.is_, binary),
+    "is_not": (op.is_not, binary),
+
+    # object operator
+    "itemgetter": (op.itemgetter, Signature([
         Parameter(name="items", kind=Parameter.VAR_POSITIONAL, annotation=str)
-    ])
-)
-attrgetter = Function(
-    op.attrgetter,
-    signature_=Signature([
+    ])),
+    "attrgetter": (op.attrgetter, Signature([
         Parameter(name="attrs", kind=Parameter.VAR_POSITIONAL, annotation=str)
-    ])
-)
-methodcaller = Function(
-    op.methodcaller,
-    signature_=Signature([
+    ])),
+    "methodcaller": (op.methodcaller, Signature([
         Parameter(name="__name", kind=Parameter.POSITIONAL_ONLY, annotation=str),
         Parameter(name="args", kind=Parameter.VAR_POSITIONAL, annotation=Any),
         Parameter(name="kwargs", kind=Parameter.VAR_KEYWORD, annotation=Any),
-    ])
-)
-
-# sequence operator
-getitem = Function(op.getitem, signature_=binary)
-setitem = Function(op.setitem, signature_=binary)
-delitem = Function(op.delitem, signature_=binary)
-index_of = Function(op.indexOf, signature_=binary)
-indexOf = index_of
-concat = Function(op.concat, signature_=binary)
-contains = Function(op.contains, signature_=binary)
-count_of = Function(op.countOf, signature_=binary)
-countOf = count_of
-length_hint = Function(op.length_hint, signature_=binary)
-
-iconcat = Function(op.iconcat, signature_=binary)
+    ])),
+
+    # sequence operator
+    "getitem": (op.getitem, binary),
+    "setitem": (op.setitem, binary),
+    "delitem": (op.delitem, binary),
+    "index_of": (op.indexOf, binary),
+    "concat": (op.concat, binary),
+    "contains": (op.contains, binary),
+    "count_of": (op.countOf, binary),
+    "length_hint": (op.length_hint, binary),
+
+    "iconcat": (op.iconcat, binary),
+}
+_aliases = {
+    "invert": "inv",
+    "indexOf": "index_of",
+    "countOf": "count_of",
+}
+
+
+def __getattr__(name: str) -> Function:
+    target = _aliases.get(name, name)
+    if target not in _operators:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if target not in globals():
+        f, signature_ = _operators[target]
+        globals()[target] = Function(f, signature_=signature_)
+    function = globals()[name] = globals()[target]
+    return function
+
+
+def __dir__():
+    return sorted({*globals(), *_operators, *_aliases})
+
+
+__all__ = [
+    "map", "filter", "reduce", "fold_chunks", "apply", "product", "pretty", "pretty_print", "fold_left", "lift_a",
+    "compose", "pipe", "identity", "const", "fork", "tap", "trace", "tracer", "configure_trace",
+    *_operators,
+    *_aliases,
+]
@@ -0,0 +1,155 @@
+import json
+import marshal
+import threading
+from dataclasses import dataclass, asdict
+from functools import wraps
+from pstats import Stats
+from time import perf_counter
+from typing import Dict, Callable, Optional, List
+
+from zpy.function import Function, Composition
+
+
+@dataclass
+class FunctionStats:
+    calls: int = 0
+    partials: int = 0
+    cumulative: float = 0.0
+    self_time: float = 0.0
+
+
+class Profiler:
+    """Patches Function and its subclasses process-wide while enabled; calls from every thread are recorded."""
+
+    _active: Optional["Profiler"] = None
+    _switch = threading.Lock()
+
+    def __init__(self, clock: Callable[[], float] = perf_counter):
+        self.clock = clock
+        self.records: Dict[str, FunctionStats] = {}
+        self._originals = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(f: Function) -> str:
+        return f"{f.__name__}{f.__applied_args__}"
+
+    def record(self, name: str) -> FunctionStats:
+        return self.records.setdefault(name, FunctionStats())
+
+    def frames(self) -> List[list]:
+        if not hasattr(self._local, "frames"):
+            self._local.frames = []
+        return self._local.frames
+
+    def instrument(self, call: Callable, cls: type) -> Callable:
+        profiler = self
+
+        @wraps(call)
+        def __call__(f: Function, *args, **kwargs):
+            frames = profiler.frames()
+            # a subclass __call__ delegating to super().__call__ is the same call, not a nested one
+            if frames and frames[-1][2] is f and frames[-1][3] is not cls:
+                return call(f, *args, **kwargs)
+            name = profiler.key(f)
+            outermost = all(frame[0] != name for frame in frames)
+            frame = [name, 0.0, f, cls]
+            frames.append(frame)
+            start = profiler.clock()
+            try:
+                return call(f, *args, **kwargs)
+            finally:
+                elapsed = profiler.clock() - start
+                frames.pop()
+                if frames:
+                    frames[-1][1] += elapsed
+                with profiler._lock:
+                    record = profiler.record(name)
+                    record.calls += 1
+                    record.self_time += elapsed - frame[1]
+                    if outermost:
+                        record.cumulative += elapsed
+
+        return __call__
+
+    def instrument_curry(self, curry: Callable) -> Callable:
+        profiler = self
+
+        @wraps(curry)
+        def instrumented(f: Function, applied_args, applied_kwargs):
+            with profiler._lock:
+                profiler.record(profiler.key(f)).partials += 1
+            return curry(f, applied_args, applied_kwargs)
+
+        return instrumented
+
+    @staticmethod
+    def run_stages(call: Callable) -> Callable:
+        @wraps(call)
+        def __call__(f: Composition, t):
+            if f.is_async:
+                return call(f, t)
+            for stage in reversed(f.functions):
+                t = stage(t)
+            return t
+
+        return __call__
+
+    def enable(self):
+        with Profiler._switch:
+            if Profiler._active is not None:
+                raise RuntimeError("a Profiler is already enabled")
+            Profiler._active = self
+            classes = [Function]
+            while classes:
+                cls = classes.pop()
+                classes.extend(cls.__subclasses__())
+                self._originals[cls] = {key: cls.__dict__[key] for key in ("__call__", "curry") if key in cls.__dict__}
+                if "__call__" in cls.__dict__:
+                    call = cls.__dict__["__call__"]
+                    if issubclass(cls, Composition):
+                        call = self.run_stages(call)
+                    cls.__call__ = self.instrument(call, cls)
+                if "curry" in cls.__dict__:
+                    cls.curry = self.instrument_curry(cls.__dict__["curry"])
+
+    def disable(self):
+        with Profiler._switch:
+            if Profiler._active is not self:
+                return
+            for cls, originals in self._originals.items():
+                for key, original in originals.items():
+                    setattr(cls, key, original)
+            self._originals.clear()
+            Profiler._active = None
+
+    def __enter__(self) -> "Profiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *_exc):
+        self.disable()
+
+    def clear(self):
+        self.records.clear()
+
+    def to_dict(self) -> Dict[str, dict]:
+        return {name: asdict(record) for name, record in self.records.items()}
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def create_stats(self):
+        self.stats = {
+            ("~", 0, name): (record.calls, record.calls, record.self_time, record.cumulative, {})
+            for name, record in self.records.items()
+        }
+
+    def to_pstats(self) -> Stats:
+        return Stats(self)
+
+    def dump_stats(self, file: str):
+        self.create_stats()
+        with open(file, "wb") as f:
+            marshal.dump(self.stats, f)
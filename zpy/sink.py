@@ -0,0 +1,133 @@
+import atexit
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Optional, TextIO
+
+if TYPE_CHECKING:
+    import logging
+
+
+class Sink(ABC):
+    @abstractmethod
+    def emit(self, record: Any):
+        ...
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+
+class PrintSink(Sink):
+    def __init__(self, file: Optional[TextIO] = None):
+        self.file = file
+
+    def emit(self, record: Any):
+        print(record, file=self.file or sys.stdout)
+
+    def flush(self):
+        (self.file or sys.stdout).flush()
+
+
+class LoggingSink(Sink):
+    def __init__(self, logger: "logging.Logger" = None, level: int = None):
+        import logging
+        self.logger = logger or logging.getLogger("zpy.trace")
+        self.level = logging.DEBUG if level is None else level
+
+    def emit(self, record: Any):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s", record)
+
+
+class BufferedSink(Sink):
+    def __init__(self, sink: Optional[Sink] = None, maxsize: int = 4096, interval: float = 0.1):
+        self.sink = sink or PrintSink()
+        self.maxsize = maxsize
+        self.interval = interval
+        self.dropped = 0
+        self._buffer = deque()
+        self._wakeup = threading.Event()
+        self._closed = threading.Event()
+        self._write_lock = threading.Lock()
+        self._worker = None
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        with self._start_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="zpy-sink", daemon=True)
+                self._worker.start()
+                atexit.register(self.close)
+
+    def emit(self, record: Any):
+        if self._worker is None:
+            self.start()
+        if len(self._buffer) >= self.maxsize:
+            self.dropped += 1
+            return
+        self._buffer.append(record)
+        if len(self._buffer) >= self.maxsize // 2:
+            self._wakeup.set()
+
+    def _run(self):
+        while not self._closed.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        buffer, emit = self._buffer, self.sink.emit
+        with self._write_lock:
+            while buffer:
+                emit(buffer.popleft())
+            self.sink.flush()
+
+    def close(self):
+        self._closed.set()
+        self._wakeup.set()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join()
+        self.flush()
+        self.sink.close()
+
+
+class Sampler:
+    def __init__(self, every_n: int = 1, rate: float = 1.0, random_: Callable[[], float] = None):
+        if every_n < 1:
+            raise ValueError(f"every_n must be positive: {every_n}")
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"rate must be in [0, 1]: {rate}")
+        self.every_n = every_n
+        self.rate = rate
+        if random_ is None:
+            from random import random as random_
+        self.random = random_
+        self.count = 0
+
+    def __call__(self) -> bool:
+        self.count += 1
+        if self.count % self.every_n:
+            return False
+        return self.rate >= 1.0 or self.random() < self.rate
+
+
+class Tracer:
+    def __init__(self, sink: Optional[Sink] = None, every_n: int = 1, rate: float = 1.0):
+        self.sink = None
+        self.sample = None
+        self.configure(sink, every_n, rate)
+
+    def configure(self, sink: Optional[Sink] = None, every_n: int = 1, rate: float = 1.0):
+        self.sink = sink or PrintSink()
+        self.sample = None if every_n == 1 and rate >= 1.0 else Sampler(every_n, rate)
+
+    def __call__(self, x: Any):
+        if self.sample is None or self.sample():
+            self.sink.emit(x)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.sink!r})"